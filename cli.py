@@ -34,11 +34,14 @@ from core.api_config import api_config
 class ForgeAPICLI:
     """Command Line Interface for Forge API Tool."""
     
-    def __init__(self):
-        """Initialize the CLI."""
+    def __init__(self, base_dir: Optional[str] = None):
+        """Initialize the CLI, optionally reading outputs/ and wildcards/ from base_dir."""
+        # Only those two folders follow base_dir; configs still come from the
+        # shared config_handler, and fix-wildcards takes its own --wildcards-dir
+        self.base_dir = base_dir
         self.forge_client = None
         self.batch_runner = None
-        self.output_manager = OutputManager()
+        self.output_manager = OutputManager(self._path("outputs"))
         self.wildcard_factory = WildcardManagerFactory()
         self.prompt_builder = PromptBuilder(self.wildcard_factory)
         self.image_analyzer = ImageAnalyzer()
@@ -47,6 +50,10 @@ class ForgeAPICLI:
         # Initialize API client if configuration exists
         self._initialize_api_client()
     
+    def _path(self, name: str) -> str:
+        """Resolve the outputs or wildcards folder against base_dir."""
+        return os.path.join(self.base_dir, name) if self.base_dir else name
+    
     def _initialize_api_client(self):
         """Initialize the API client if configuration is available."""
         try:
@@ -309,7 +316,7 @@ class ForgeAPICLI:
     def list_wildcards(self) -> None:
         """List available wildcard files."""
         try:
-            wildcard_dir = "wildcards"
+            wildcard_dir = self._path("wildcards")
             if not os.path.exists(wildcard_dir):
                 print("📁 No wildcards directory found")
                 return
@@ -407,7 +414,7 @@ class ForgeAPICLI:
             
             # Wildcard count
             try:
-                wildcard_dir = "wildcards"
+                wildcard_dir = self._path("wildcards")
                 if os.path.exists(wildcard_dir):
                     wildcard_files = []
                     for root, dirs, files in os.walk(wildcard_dir):
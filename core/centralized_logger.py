@@ -9,12 +9,18 @@ that handles application logs, output logs, and performance metrics in one place
 import logging
 import os
 import json
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 import traceback
 
 
+# Most JSON-lines log files kept open at once (files fan out by event type, day and job)
+MAX_OPEN_LOG_FILES = 32
+
+
 class CentralizedLogger:
     """
     Centralized logging system that handles all logging needs for the Forge API Tool.
@@ -42,6 +48,10 @@ class CentralizedLogger:
         for directory in [self.error_dir, self.performance_dir, self.application_dir, self.sessions_dir]:
             directory.mkdir(exist_ok=True)
         
+        # Open append handles for the JSON-lines files, least recently used first
+        self._json_files = OrderedDict()
+        self._json_files_lock = threading.Lock()
+        
         # Configure main logger
         self.logger = logging.getLogger('forge_api_tool')
         self.logger.setLevel(logging.INFO)
@@ -107,6 +117,31 @@ class CentralizedLogger:
         console_handler.setFormatter(self.formatter)
         self.logger.addHandler(console_handler)
     
+    def _append_json_line(self, path: Path, record: Dict[str, Any]):
+        """Append a record to a JSON-lines file, reusing its open handle."""
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._json_files_lock:
+            f = self._json_files.pop(path, None)
+            if f is None:
+                f = open(path, 'a', encoding='utf-8')
+                if len(self._json_files) >= MAX_OPEN_LOG_FILES:
+                    _, oldest = self._json_files.popitem(last=False)
+                    oldest.close()
+            try:
+                f.write(line)
+                f.flush()
+            except Exception:
+                f.close()
+                raise
+            self._json_files[path] = f
+    
+    def close_log_files(self):
+        """Close the JSON-lines handles kept open between log calls."""
+        with self._json_files_lock:
+            while self._json_files:
+                _, f = self._json_files.popitem()
+                f.close()
+    
     def log_app_event(self, event_type: str, data: Dict[str, Any] = None):
         """Log application events with structured data."""
         event_data = {
@@ -118,8 +153,7 @@ class CentralizedLogger:
         # Log to application directory
         event_file = self.application_dir / f"{event_type}_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(event_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(event_data, ensure_ascii=False) + '\n')
+            self._append_json_line(event_file, event_data)
         except Exception as e:
             self.logger.error(f"Failed to write event log: {e}")
         
@@ -140,8 +174,7 @@ class CentralizedLogger:
         # Log to error directory
         error_file = self.error_dir / f"errors_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(error_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(error_data, ensure_ascii=False) + '\n')
+            self._append_json_line(error_file, error_data)
         except Exception as e:
             self.logger.error(f"Failed to write error log: {e}")
         
@@ -165,8 +198,7 @@ class CentralizedLogger:
         # Also save to performance directory
         perf_file = self.performance_dir / f"api_performance_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(perf_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(api_data, ensure_ascii=False) + '\n')
+            self._append_json_line(perf_file, api_data)
         except Exception as e:
             self.logger.error(f"Failed to write performance log: {e}")
     
@@ -190,8 +222,7 @@ class CentralizedLogger:
         # Also save to error directory
         error_file = self.error_dir / f"api_errors_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(error_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(api_error_data, ensure_ascii=False) + '\n')
+            self._append_json_line(error_file, api_error_data)
         except Exception as e:
             self.logger.error(f"Failed to write API error log: {e}")
     
@@ -207,8 +238,7 @@ class CentralizedLogger:
         # Log to performance directory
         perf_file = self.performance_dir / f"performance_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(perf_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(perf_data, ensure_ascii=False) + '\n')
+            self._append_json_line(perf_file, perf_data)
         except Exception as e:
             self.logger.error(f"Failed to write performance log: {e}")
         
@@ -230,8 +260,7 @@ class CentralizedLogger:
         # Also save to sessions directory
         session_file = self.sessions_dir / f"job_{job_id}_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(session_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(job_data, ensure_ascii=False) + '\n')
+            self._append_json_line(session_file, job_data)
         except Exception as e:
             self.logger.error(f"Failed to write job log: {e}")
     
@@ -303,6 +332,9 @@ class CentralizedLogger:
     def cleanup_old_logs(self, days_to_keep: int = 30):
         """Clean up old log files."""
         try:
+            # Release held handles so old files can be deleted (required on Windows)
+            self.close_log_files()
+            
             cutoff_date = datetime.now().timestamp() - (days_to_keep * 24 * 3600)
             deleted_count = 0
             failed_deletions = []
@@ -398,8 +430,7 @@ class CentralizedLogger:
         # Log to application directory
         config_file = self.application_dir / f"config_operations_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(config_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(config_data, ensure_ascii=False) + '\n')
+            self._append_json_line(config_file, config_data)
         except Exception as e:
             self.logger.error(f"Failed to write config operation log: {e}")
         
@@ -419,8 +450,7 @@ class CentralizedLogger:
         # Log to application directory
         queue_file = self.application_dir / f"queue_operations_{datetime.now().strftime('%Y%m%d')}.json"
         try:
-            with open(queue_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(queue_data, ensure_ascii=False) + '\n')
+            self._append_json_line(queue_file, queue_data)
         except Exception as e:
             self.logger.error(f"Failed to write queue operation log: {e}")
         
@@ -2,8 +2,8 @@ import json
 import os
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-import re
 from core.centralized_logger import logger
+from core.wildcard_manager import WILDCARD_RE
 
 
 class ConfigHandler:
@@ -32,6 +32,8 @@ class ConfigHandler:
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
+            # Reject configs that can never validate before building their defaults
+            self._validate_identity(config, config_name)
             # Set default values
             config = self._set_defaults(config)
             # Validate configuration (structure only)
@@ -240,8 +242,8 @@ class ConfigHandler:
         
         return result
     
-    def _validate_config(self, config: Dict[str, Any], config_name: str = "<unknown>"):
-        """Validate configuration structure and values."""
+    def _validate_identity(self, config: Dict[str, Any], config_name: str = "<unknown>"):
+        """Validate the fields that defaults never fill in (name and model type)."""
         # Basic required fields
         required_fields = ['name', 'model_type']
         
@@ -252,6 +254,10 @@ class ConfigHandler:
         # Validate model type
         if config['model_type'] not in ['sd', 'sdxl', 'xl', 'flux']:
             raise ValueError(f"Config '{config_name}': Invalid model type: {config['model_type']}")
+    
+    def _validate_config(self, config: Dict[str, Any], config_name: str = "<unknown>"):
+        """Validate configuration structure and values."""
+        self._validate_identity(config, config_name)
         
         # Check for generation settings (required for image generation)
         if 'generation_settings' not in config:
@@ -281,8 +287,7 @@ class ConfigHandler:
     
     def extract_wildcards_from_template(self, template: str) -> List[str]:
         """Extract wildcard names from prompt template using Automatic1111 format."""
-        pattern = r'__([A-Z_]+)__'
-        return re.findall(pattern, template)
+        return WILDCARD_RE.findall(template)
     
     def validate_wildcards(self, config: Dict[str, Any]) -> Dict[str, List[str]]:
         """Validate that all wildcards in template have corresponding files."""
@@ -293,9 +298,20 @@ class ConfigHandler:
         available_wildcards = []
         missing_files = []
         
+        # List the wildcards directory once instead of stat-ing a path per wildcard
+        wildcard_files = set()
+        if wildcard_names:
+            try:
+                wildcard_files = {os.path.normcase(name) for name in os.listdir('wildcards')}
+            except OSError:
+                pass
+        
         for wildcard_name in wildcard_names:
-            wildcard_path = os.path.join('wildcards', f'{wildcard_name.lower()}.txt')
-            if os.path.exists(wildcard_path):
+            wildcard_file = f'{wildcard_name.lower()}.txt'
+            wildcard_path = os.path.join('wildcards', wildcard_file)
+            # normcase only folds case on Windows, so a miss on another case-insensitive
+            # filesystem (e.g. macOS) is confirmed with a real lookup
+            if os.path.normcase(wildcard_file) in wildcard_files or os.path.exists(wildcard_path):
                 available_wildcards.append(wildcard_name)
             else:
                 missing_wildcards.append(wildcard_name)
@@ -4,6 +4,7 @@ import io
 from typing import Dict, Any, Optional, List
 from PIL import Image, PngImagePlugin
 import re
+from core.wildcard_manager import WILDCARD_RE
 
 
 class ImageAnalyzer:
@@ -235,8 +236,7 @@ class ImageAnalyzer:
         wildcards = []
         
         # Look for Automatic1111 wildcard patterns only
-        pattern = r'__([A-Z_]+)__'  # __wildcard_name__ (Automatic1111 format)
-        matches = re.findall(pattern, prompt)
+        matches = WILDCARD_RE.findall(prompt)
         wildcards.extend(matches)
         
         return list(set(wildcards))  # Remove duplicates
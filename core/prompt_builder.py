@@ -1,8 +1,7 @@
-import re
 import os
 import random
 from typing import Dict, List, Any, Tuple
-from .wildcard_manager import WildcardManagerFactory
+from .wildcard_manager import WildcardManagerFactory, WILDCARD_RE
 
 
 class PromptBuilder:
@@ -79,9 +78,7 @@ class PromptBuilder:
     
     def _extract_wildcards(self, template: str) -> List[str]:
         """Extract wildcard names from template string using Automatic1111 format."""
-        # Automatic1111 uses __WILDCARD_NAME__ format
-        pattern = r'__([A-Z_]+)__'
-        return re.findall(pattern, template)
+        return WILDCARD_RE.findall(template)
     
     def _get_usage_status(self, percentage: float) -> str:
         """Get usage status based on percentage."""
@@ -3,6 +3,10 @@ import json
 import os
 from typing import List, Dict, Optional
 from pathlib import Path
+import re
+
+# Automatic1111 wildcard placeholder, e.g. __STYLE__; shared by every module that looks for wildcards
+WILDCARD_RE = re.compile(r'__([A-Z_]+)__')
 
 
 class WildcardManager:
@@ -31,13 +31,14 @@ def check_file_encoding(file_path: str) -> Tuple[bool, str, str]:
         Tuple of (needs_fix, current_encoding, error_message)
     """
     try:
+        # The BOM is all we need, so only read its two bytes
         with open(file_path, 'rb') as f:
-            content = f.read()
+            head = f.read(2)
         
         # Check for UTF-16 BOM
-        if content.startswith(b'\xff\xfe'):
+        if head == b'\xff\xfe':
             return True, "UTF-16", ""
-        elif content.startswith(b'\xfe\xff'):
+        elif head == b'\xfe\xff':
             return True, "UTF-16-BE", ""
         else:
             return False, "UTF-8", ""
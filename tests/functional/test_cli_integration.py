@@ -12,6 +12,8 @@ import json
 import shutil
 import subprocess
 import time
+import io
+from contextlib import redirect_stdout
 from pathlib import Path
 from unittest.mock import patch, Mock
 
@@ -19,6 +21,7 @@ from unittest.mock import patch, Mock
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+import cli
 from cli import ForgeAPICLI
 
 
@@ -299,7 +302,21 @@ class TestCLIIntegration(unittest.TestCase):
             self.skipTest("CLI script not found")
     
     def test_cli_test_connection_command(self):
-        """Test CLI test connection command."""
+        """Test CLI test connection command against a canned Forge response."""
+        # Answer the progress probe in-process instead of opening a socket to the Forge server
+        with patch('requests.Session.get', return_value=Mock(status_code=200)) as mock_get, \
+             patch('sys.argv', ['cli.py', 'test']), \
+             redirect_stdout(io.StringIO()) as output:
+            cli.main()
+        
+        mock_get.assert_called_once()
+        self.assertIn('/sdapi/v1/progress', mock_get.call_args[0][0])
+        self.assertIn('API connection successful', output.getvalue())
+    
+    @unittest.skipUnless(os.environ.get('FORGE_API_INTEGRATION'),
+                         "set FORGE_API_INTEGRATION=1 to test against a running Forge server")
+    def test_cli_test_connection_command_live(self):
+        """Test CLI test connection command against the real Forge server."""
         try:
             result = subprocess.run(
                 [sys.executable, 'cli.py', 'test'],
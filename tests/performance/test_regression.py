@@ -32,6 +32,16 @@ from core.output_manager import OutputManager
 class TestPerformanceRegression(TestCase):
     """Performance regression tests."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up components shared by every test in the class."""
+        cls.wildcard_factory = WildcardManagerFactory()
+        
+        # Load benchmarks once; _update_benchmark keeps the dict and the file in step
+        cls.benchmarks_file = Path('tests/performance/benchmarks.json')
+        cls.benchmarks_file.parent.mkdir(exist_ok=True)
+        cls.benchmarks = cls._load_benchmarks()
+    
     def setUp(self):
         """Set up test fixtures."""
         self.temp_dir = os.path.join(os.getcwd(), 'temp_test_dir')
@@ -43,13 +53,7 @@ class TestPerformanceRegression(TestCase):
         os.makedirs(os.path.join(self.temp_dir, 'outputs'), exist_ok=True)
         
         # Initialize components
-        self.wildcard_factory = WildcardManagerFactory()
         self.output_manager = OutputManager(os.path.join(self.temp_dir, 'outputs'))
-        
-        # Load benchmarks
-        self.benchmarks_file = Path('tests/performance/benchmarks.json')
-        self.benchmarks_file.parent.mkdir(exist_ok=True)
-        self.benchmarks = self._load_benchmarks()
     
     def tearDown(self):
         """Clean up test fixtures."""
@@ -433,11 +437,12 @@ class TestPerformanceRegression(TestCase):
             self._update_benchmark(benchmark_key, total_time)
     
     # Helper methods
-    def _load_benchmarks(self):
+    @classmethod
+    def _load_benchmarks(cls):
         """Load performance benchmarks from file."""
-        if self.benchmarks_file.exists():
+        if cls.benchmarks_file.exists():
             try:
-                with open(self.benchmarks_file, 'r') as f:
+                with open(cls.benchmarks_file, 'r') as f:
                     return json.load(f)
             except (json.JSONDecodeError, IOError):
                 pass
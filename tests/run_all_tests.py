@@ -1,22 +1,71 @@
 #!/usr/bin/env python3
 """
 Comprehensive test runner for the Forge API Tool.
-Runs all unit tests for core functionality.
+Runs the unit and functional test suites; use --categories to select a subset,
+or --comprehensive to run every test group.
 """
 
 import unittest
 import sys
 import os
+import io
 import time
+import json
+import argparse
+import signal
+import threading
+import subprocess
+import tempfile
+import functools
+import importlib
+import importlib.util
+import xml.etree.ElementTree as ET
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from enum import IntEnum
+from typing import NamedTuple
 from datetime import datetime
 
-# Add the project root to the path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+import pytest
 
-def run_all_tests():
-    """Run all tests and return results."""
-    print("🧪 Forge API Tool - Unit Test Suite")
+# Add the project root to the path (resolved once; reuse these constants)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_ROOT_STR = str(PROJECT_ROOT)
+sys.path.insert(0, PROJECT_ROOT_STR)
+
+# Descriptors Python opens are non-inheritable (PEP 446), so on POSIX the
+# child-side scan that closes inherited fds is pure spawn overhead
+_CLOSE_FDS = sys.platform == "win32"
+
+# Test inventory shared by the full run and the per-category runs
+TEST_CATEGORIES = {
+    'Unit Tests': [
+        'tests.unit.test_config_handler',
+        'tests.unit.test_image_analyzer',
+        'tests.unit.test_output_manager',
+        'tests.unit.test_wildcard_manager',
+        'tests.unit.test_imports'
+    ],
+    'Functional Tests': [
+        'tests.functional.test_cli_integration'
+    ]
+}
+
+# Command-line category names mapped to TEST_CATEGORIES keys
+CATEGORY_KEYS = {
+    'unit': 'Unit Tests',
+    'functional': 'Functional Tests'
+}
+
+def run_all_tests(categories=None):
+    """Run all tests (or only the given command-line categories) and return results."""
+    if categories:
+        selected = {CATEGORY_KEYS[name]: TEST_CATEGORIES[CATEGORY_KEYS[name]] for name in categories}
+    else:
+        selected = TEST_CATEGORIES
+    
+    print("🧪 Forge API Tool - Test Suite")
     print("=" * 60)
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
@@ -25,43 +74,30 @@ def run_all_tests():
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
     
-    # Test categories - only unit tests remain
-    test_categories = {
-        'Unit Tests': [
-            'tests.unit.test_config_handler',
-            'tests.unit.test_image_analyzer',
-            'tests.unit.test_output_manager',
-            'tests.unit.test_wildcard_manager',
-            'tests.unit.test_imports'
-        ]
-    }
-    
-    # Add tests to suite
+    # Add tests to suite; a module that fails to load is recorded and the rest still run
     total_tests = 0
-    for category, test_modules in test_categories.items():
+    load_errors = {}
+    for category, test_modules in selected.items():
         print(f"📋 Loading {category}...")
         category_tests = 0
         
         for module_name in test_modules:
             try:
-                # Load the test module
-                module = __import__(module_name, fromlist=[''])
-                
-                # Add all tests from the module
+                module = importlib.import_module(module_name)
                 module_suite = loader.loadTestsFromModule(module)
-                suite.addTest(module_suite)
-                
-                # Count tests in this module
-                module_test_count = module_suite.countTestCases()
-                category_tests += module_test_count
-                total_tests += module_test_count
-                
-                print(f"  ✅ {module_name}: {module_test_count} tests")
-                
-            except ImportError as e:
-                print(f"  ❌ {module_name}: Import failed - {e}")
             except Exception as e:
-                print(f"  ❌ {module_name}: Loading failed - {e}")
+                load_errors[module_name] = f"{type(e).__name__}: {e}"
+                print(f"  ❌ {module_name}: Loading failed - {load_errors[module_name]}")
+                continue
+            
+            suite.addTest(module_suite)
+            
+            # Count tests in this module
+            module_test_count = module_suite.countTestCases()
+            category_tests += module_test_count
+            total_tests += module_test_count
+            
+            print(f"  ✅ {module_name}: {module_test_count} tests")
         
         print(f"  📊 {category}: {category_tests} tests loaded")
         print()
@@ -73,10 +109,12 @@ def run_all_tests():
     # Run tests
     start_time = time.time()
     
-    # Create test runner with detailed output
+    # Create test runner with detailed output, buffered so a slow console
+    # doesn't throttle the run; the output and summary are written out once
+    output_buffer = io.StringIO()
     runner = unittest.TextTestRunner(
         verbosity=2,
-        stream=sys.stdout,
+        stream=output_buffer,
         descriptions=True,
         failfast=False
     )
@@ -88,40 +126,53 @@ def run_all_tests():
     duration = end_time - start_time
     
     # Print summary
-    print()
-    print("=" * 60)
-    print("📊 TEST SUMMARY")
-    print("=" * 60)
-    print(f"Total tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}")
-    print(f"Duration: {duration:.2f} seconds")
-    print()
+    print(file=output_buffer)
+    print("=" * 60, file=output_buffer)
+    print("📊 TEST SUMMARY", file=output_buffer)
+    print("=" * 60, file=output_buffer)
+    print(f"Total tests run: {result.testsRun}", file=output_buffer)
+    print(f"Failures: {len(result.failures)}", file=output_buffer)
+    print(f"Errors: {len(result.errors)}", file=output_buffer)
+    print(f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}", file=output_buffer)
+    print(f"Modules failed to load: {len(load_errors)}", file=output_buffer)
+    print(f"Duration: {duration:.2f} seconds", file=output_buffer)
+    print(file=output_buffer)
+    
+    if load_errors:
+        print("📦 LOAD ERRORS:", file=output_buffer)
+        print("-" * 30, file=output_buffer)
+        for module_name, error in load_errors.items():
+            print(f"Module: {module_name}", file=output_buffer)
+            print(f"Error: {error}", file=output_buffer)
+            print(file=output_buffer)
     
     # Print detailed results
     if result.failures:
-        print("❌ FAILURES:")
-        print("-" * 30)
+        print("❌ FAILURES:", file=output_buffer)
+        print("-" * 30, file=output_buffer)
         for test, traceback in result.failures:
-            print(f"Test: {test}")
-            print(f"Traceback:\n{traceback}")
-            print()
+            print(f"Test: {test}", file=output_buffer)
+            print(f"Traceback:\n{traceback}", file=output_buffer)
+            print(file=output_buffer)
     
     if result.errors:
-        print("🚨 ERRORS:")
-        print("-" * 30)
+        print("🚨 ERRORS:", file=output_buffer)
+        print("-" * 30, file=output_buffer)
         for test, traceback in result.errors:
-            print(f"Test: {test}")
-            print(f"Traceback:\n{traceback}")
-            print()
+            print(f"Test: {test}", file=output_buffer)
+            print(f"Traceback:\n{traceback}", file=output_buffer)
+            print(file=output_buffer)
     
     # Print success rate
     success_rate = ((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100) if result.testsRun > 0 else 0
-    print(f"✅ Success Rate: {success_rate:.1f}%")
+    print(f"✅ Success Rate: {success_rate:.1f}%", file=output_buffer)
+    
+    # Write the run log and summary out in a single call
+    sys.stdout.write(output_buffer.getvalue())
+    sys.stdout.flush()
     
     # Return appropriate exit code
-    if result.failures or result.errors:
+    if result.failures or result.errors or load_errors:
         print("❌ Some tests failed!")
         return 1
     else:
@@ -131,33 +182,29 @@ def run_all_tests():
 
 def run_specific_category(category):
     """Run tests from a specific category."""
-    categories = {
-        'unit': os.path.join(os.path.dirname(os.path.abspath(__file__)), 'unit')
-    }
-    
-    if category not in categories:
+    if category not in CATEGORY_KEYS:
         print(f"❌ Unknown category: {category}")
-        print(f"Available categories: {', '.join(categories.keys())}")
+        print(f"Available categories: {', '.join(CATEGORY_KEYS.keys())}")
         return 1
     
     print(f"🧪 Running {category} tests...")
     
-    # Create test suite for specific category
+    # Load the category's modules by name instead of walking the directory
     loader = unittest.TestLoader()
-    
-    # Add the category directory to Python path
-    category_path = categories[category]
-    if category_path not in sys.path:
-        sys.path.insert(0, category_path)
-    
-    # Discover tests in the category directory
-    suite = loader.discover(category_path, pattern='test_*.py')
+    suite = unittest.TestSuite()
+    load_failed = False
+    for module_name in TEST_CATEGORIES[CATEGORY_KEYS[category]]:
+        try:
+            suite.addTest(loader.loadTestsFromModule(importlib.import_module(module_name)))
+        except Exception as e:
+            load_failed = True
+            print(f"❌ {module_name}: Loading failed - {type(e).__name__}: {e}")
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
     
-    return 0 if not (result.failures or result.errors) else 1
+    return 0 if not (result.failures or result.errors or load_failed) else 1
 
 
 def run_specific_test(test_name):
@@ -175,21 +222,715 @@ def run_specific_test(test_name):
     return 0 if not (result.failures or result.errors) else 1
 
 
-if __name__ == '__main__':
-    import argparse
+def list_tests():
+    """List the tests pytest actually collects under tests/."""
+    result = subprocess.run(
+        [sys.executable, '-m', 'pytest', '--collect-only', '-q',
+         os.path.join(PROJECT_ROOT_STR, 'tests')],
+        cwd=PROJECT_ROOT_STR,
+        close_fds=_CLOSE_FDS,
+        check=False
+    )
+    return result.returncode
+
+
+
+# Comprehensive run: every test group through pytest, with optional
+# parallel (xdist), isolated and batched execution
+
+# Subprocess invariants, built once rather than per test file: the base pytest
+# command and an environment that lets child interpreters import project modules
+_PYTEST_COMMAND = (sys.executable, "-m", "pytest")
+_SUBPROCESS_ENV = os.environ.copy()
+_SUBPROCESS_ENV["PYTHONPATH"] = os.pathsep.join(
+    filter(None, [PROJECT_ROOT_STR, _SUBPROCESS_ENV.get("PYTHONPATH")])
+)
+
+# pytest-xdist is optional; when installed, pytest runs are spread across all cores
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# pytest-timeout is optional; when installed it bounds in-process pytest runs,
+# which have no subprocess deadline of their own
+TIMEOUT_PLUGIN_AVAILABLE = importlib.util.find_spec("pytest_timeout") is not None
+
+# Modules that must import cleanly before the full suite is worth running
+QUICK_CHECK_MODULES = (
+    "core.config_handler",
+    "core.centralized_logger",
+    "core.output_manager",
+    "core.job_queue",
+    "core.batch_runner",
+    "core.wildcard_manager",
+    "core.image_analyzer",
+)
+
+# Resolved test files already executed in this run, so overlapping groups
+# (e.g. the CLI stress file and the stress directory) never run a file twice
+_executed_files = set()
+
+# Test files per pytest subprocess in isolated runs; 1 gives every file its own interpreter
+DEFAULT_BATCH_SIZE = 8
+
+# Subprocess deadlines: the 5 minute ceiling, and the floor for adaptive timeouts
+DEFAULT_TIMEOUT = 300
+MIN_TIMEOUT = 10
+
+# Per-file durations of passing runs, kept between runs to size adaptive timeouts
+DURATIONS_FILE = PROJECT_ROOT / ".test_durations.json"
+_recorded_durations = {}
+
+# Extra pytest flags for every pytest run, set from the command line; --ff uses
+# pytest's own cache of last failures to schedule previously failing tests first
+_pytest_order_args = []
+
+# Lines of subprocess output kept for the report of a failing run
+OUTPUT_TAIL_LINES = 200
+
+# Seconds to wait for a killed subprocess's output to drain before giving up on it
+READER_JOIN_TIMEOUT = 5
+
+# One unittest loader and runner shared by every in-process unittest run
+_LOADER = unittest.TestLoader()
+_RUNNER = unittest.TextTestRunner(verbosity=2)
+
+# Serializes report output from concurrently running subprocesses
+_print_lock = threading.Lock()
+
+
+class Status(IntEnum):
+    """Outcome of one test suite."""
+    
+    PASS = 1
+    FAIL = 2
+    WARN = 3  # an optional suite could not be run, e.g. the web dashboard tests
+
+
+STATUS_LABELS = {
+    Status.PASS: "✅ PASS",
+    Status.FAIL: "❌ FAIL",
+    Status.WARN: "⚠️  WARN",
+}
+
+
+class TestResult(NamedTuple):
+    """Outcome of one test suite, kept structured until the report is printed."""
+    
+    name: str
+    status: Status
+    duration: float
+
+
+def _status(success):
+    """Map a pass/fail flag to its Status."""
+    return Status.PASS if success else Status.FAIL
+
+
+class _OutcomeCollector:
+    """pytest plugin recording the outcome of every test in an in-process run."""
     
+    def __init__(self):
+        self.outcomes = {}
+    
+    def pytest_runtest_logreport(self, report):
+        # A failure in any phase (setup, call or teardown) marks the test as failed
+        if report.failed:
+            self.outcomes[report.nodeid] = "failed"
+        elif report.when == "call" or report.skipped:
+            self.outcomes.setdefault(report.nodeid, report.outcome)
+
+
+def _run_pytest_in_process(pytest_args, test_type):
+    """Run pytest inside this interpreter so imports are paid for only once."""
+    collector = _OutcomeCollector()
+    start_time = time.time()
+    
+    try:
+        exit_code = pytest.main(pytest_args, plugins=[collector])
+    except Exception as e:
+        print(f"❌ Error running {test_type} tests: {e}")
+        return False, 0
+    
+    duration = time.time() - start_time
+    counts = Counter(collector.outcomes.values())
+    
+    print(f"Duration: {duration:.2f} seconds")
+    print(f"Exit code: {int(exit_code)}")
+    print(f"Passed: {counts['passed']}, Failed: {counts['failed']}, Skipped: {counts['skipped']}")
+    
+    return exit_code == 0, duration
+
+
+def _kill_process_tree(process):
+    """Kill a pytest subprocess together with any workers it started."""
+    if sys.platform == "win32":
+        process.kill()
+        return
+    
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _run_pytest_subprocess(pytest_args, test_type, header, timeout=DEFAULT_TIMEOUT):
+    """Run pytest in a fresh interpreter and print its report as one block.
+    
+    The child's output is streamed through a bounded buffer and only its tail
+    is reported, on failure. The report is printed under a lock, so several of
+    these can run concurrently without interleaving.
+    """
+    lines = [header]
+    start_time = time.time()
+    
+    try:
+        process = subprocess.Popen(
+            [*_PYTEST_COMMAND, *pytest_args],
+            env=_SUBPROCESS_ENV,
+            close_fds=_CLOSE_FDS,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            # Own process group on POSIX, so a timeout also kills xdist workers
+            start_new_session=sys.platform != "win32"
+        )
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        reader = threading.Thread(target=tail.extend, args=(process.stdout,), daemon=True)
+        reader.start()
+        
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process_tree(process)
+            process.wait()
+            raise
+        finally:
+            # A grandchild that survived the kill can hold the pipe open; the
+            # reader is a daemon thread, so it is left to finish on its own
+            reader.join(timeout=READER_JOIN_TIMEOUT)
+            if not reader.is_alive():
+                process.stdout.close()
+        
+        end_time = time.time()
+        duration = end_time - start_time
+        success = returncode == 0
+        
+        lines.append(f"Duration: {duration:.2f} seconds")
+        lines.append(f"Return code: {returncode}")
+        
+        if not success and tail:
+            lines.append(f"\nOUTPUT (last {len(tail)} lines):")
+            lines.append("".join(tail))
+        
+    except subprocess.TimeoutExpired:
+        lines.append(f"❌ {test_type} tests timed out after {timeout} seconds")
+        success, duration = False, timeout
+    except Exception as e:
+        lines.append(f"❌ Error running {test_type} tests: {e}")
+        success, duration = False, 0
+    
+    with _print_lock:
+        print("\n".join(lines))
+    
+    return success, duration
+
+
+def run_tests_with_pytest(test_paths, test_type="unit", use_xdist=True, isolated=False):
+    """Run tests using pytest with detailed output.
+    
+    Tests run in-process via pytest.main() unless isolated is set, in which
+    case a fresh interpreter is spawned for them.
+    """
+    header = f"\n{'='*60}\nRunning {test_type.upper()} tests: {', '.join(test_paths)}\n{'='*60}"
+    
+    pytest_args = [*test_paths, "-v", "--tb=short", *_pytest_order_args]
+    if use_xdist and XDIST_AVAILABLE:
+        pytest_args += ["-n", "auto"]
+    
+    if isolated:
+        return _run_pytest_subprocess(pytest_args, test_type, header)
+    
+    if TIMEOUT_PLUGIN_AVAILABLE:
+        pytest_args.append(f"--timeout={DEFAULT_TIMEOUT}")
+    print(header)
+    return _run_pytest_in_process(pytest_args, test_type)
+
+
+def _module_name(test_file):
+    """Return the dotted module name of a test file under the project root."""
+    relative = os.path.relpath(test_file, PROJECT_ROOT_STR)
+    return os.path.splitext(relative)[0].replace(os.sep, ".")
+
+
+def run_tests_with_unittest(test_path, test_type="unit"):
+    """Run tests using unittest with detailed output."""
+    print(f"\n{'='*60}")
+    print(f"Running {test_type.upper()} tests: {test_path}")
+    print(f"{'='*60}")
+    
+    start_time = time.time()
+    
+    try:
+        # Load the file's module by dotted name through the shared loader, so
+        # modules already imported in this run are reused from sys.modules
+        suite = _LOADER.loadTestsFromName(_module_name(test_path))
+        result = _RUNNER.run(suite)
+        
+        end_time = time.time()
+        duration = end_time - start_time
+        
+        print(f"Duration: {duration:.2f} seconds")
+        print(f"Tests run: {result.testsRun}")
+        print(f"Failures: {len(result.failures)}")
+        print(f"Errors: {len(result.errors)}")
+        
+        if result.failures:
+            print("\nFAILURES:")
+            for test, traceback in result.failures:
+                print(f"\n{test}:")
+                print(traceback)
+        
+        if result.errors:
+            print("\nERRORS:")
+            for test, traceback in result.errors:
+                print(f"\n{test}:")
+                print(traceback)
+        
+        return len(result.failures) == 0 and len(result.errors) == 0, duration
+        
+    except Exception as e:
+        print(f"❌ Error running {test_type} tests: {e}")
+        return False, 0
+
+
+def _iter_test_files(test_dir):
+    """Yield the test files in test_dir as the directory listing streams in.
+    
+    os.scandir reports entry types straight from the directory listing, so no
+    separate exists/stat call is needed per entry.
+    """
+    with os.scandir(test_dir) as entries:
+        for entry in entries:
+            if (entry.is_file(follow_symlinks=False)
+                    and entry.name.startswith("test_") and entry.name.endswith(".py")):
+                yield entry.path
+
+
+@functools.lru_cache(maxsize=None)
+def _discover(test_dir):
+    """Return the sorted test files in test_dir, cached so each directory is listed once."""
+    return tuple(sorted(_iter_test_files(test_dir)))
+
+
+def _claim_test_files(test_path):
+    """Return the test files under test_path that have not run yet, marking them as run.
+    
+    Relative paths are taken from the project root. Raises FileNotFoundError
+    when test_path does not exist.
+    """
+    resolved = os.path.realpath(os.path.join(PROJECT_ROOT_STR, test_path))
+    try:
+        candidates = _discover(resolved)
+    except NotADirectoryError:
+        candidates = (resolved,)
+    
+    claimed = []
+    for candidate in candidates:
+        if candidate not in _executed_files:
+            _executed_files.add(candidate)
+            claimed.append(candidate)
+    
+    return claimed
+
+
+def run_test_group(tests, group_name, use_xdist=True, isolated=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Run a group of Python test suites.
+    
+    With pytest-xdist available the whole group runs as a single parallel
+    pytest invocation. Otherwise each file runs on its own: through unittest
+    in-process, or, when isolated, in concurrent pytest subprocesses that
+    each take up to batch_size files.
+    """
+    results = []
+    pending = []
+    
+    for test_path, test_name in tests:
+        try:
+            test_files = _claim_test_files(test_path)
+        except FileNotFoundError:
+            print(f"❌ Test file not found: {test_path}")
+            results.append(TestResult(test_name, Status.FAIL, 0))
+            continue
+        
+        if test_files:
+            pending.append((test_files, test_name))
+        else:
+            print(f"⏭️  Skipping {test_name}: already run in this session")
+    
+    if use_xdist and XDIST_AVAILABLE:
+        if pending:
+            test_paths = [test_file for test_files, _ in pending for test_file in test_files]
+            success, duration = run_tests_with_pytest(test_paths, group_name, True, isolated)
+            results.append(TestResult(group_name, _status(success), duration))
+        return results
+    
+    if isolated:
+        outcomes = _run_files_concurrently(pending, group_name, batch_size)
+    else:
+        outcomes = {
+            test_name: [run_tests_with_unittest(test_file, test_name) for test_file in test_files]
+            for test_files, test_name in pending
+        }
+    
+    for _, test_name in pending:
+        runs = outcomes[test_name]
+        success = all(passed for passed, _ in runs)
+        duration = sum(elapsed for _, elapsed in runs)
+        results.append(TestResult(test_name, _status(success), duration))
+    
+    return results
+
+
+def _run_files_concurrently(pending, group_name, batch_size=DEFAULT_BATCH_SIZE):
+    """Run the pending test files in batched pytest subprocesses, up to one per core.
+    
+    Batching amortizes interpreter startup across several files; threads are
+    enough here because the work happens in the child processes.
+    """
+    owners = {test_file: test_name for test_files, test_name in pending for test_file in test_files}
+    # Longest first, so stragglers start early and short files fill the gaps
+    test_files = sorted(owners, key=lambda test_file: -_previous_durations.get(_duration_key(test_file), 0))
+    batches = [test_files[i:i + batch_size] for i in range(0, len(test_files), batch_size)]
+    outcomes = {test_name: [] for _, test_name in pending}
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_run_batch, batch, group_name) for batch in batches]
+        for future in as_completed(futures):
+            for test_file, outcome in future.result().items():
+                outcomes[owners[test_file]].append(outcome)
+    
+    return outcomes
+
+
+def _run_batch(test_files, group_name):
+    """Run several test files in one pytest subprocess and return (success, duration) per file."""
+    fd, junit_path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    
+    try:
+        header = f"\n{'='*60}\nRunning {group_name.upper()} batch: {', '.join(test_files)}\n{'='*60}"
+        pytest_args = [
+            *test_files, "-v", "--tb=short", *_pytest_order_args,
+            f"--rootdir={PROJECT_ROOT_STR}",
+            f"--junitxml={junit_path}",
+            "-o", "junit_family=xunit1"
+        ]
+        timeout = _batch_timeout(test_files)
+        batch_success, _ = _run_pytest_subprocess(pytest_args, group_name, header, timeout)
+        per_file = _parse_junit_by_file(junit_path)
+    finally:
+        os.remove(junit_path)
+    
+    _recorded_durations.update(
+        (_duration_key(test_file), round(duration, 3))
+        for test_file, (passed, duration) in per_file.items() if passed
+    )
+    
+    # Files without test cases in the report (e.g. collection errors) take the batch verdict
+    return {test_file: per_file.get(test_file, (batch_success, 0)) for test_file in test_files}
+
+
+def _duration_key(test_file):
+    """Key a test file in the durations cache by its project-relative path."""
+    return Path(os.path.relpath(test_file, PROJECT_ROOT_STR)).as_posix()
+
+
+def _load_durations():
+    """Load per-file durations recorded by earlier runs."""
+    try:
+        with open(DURATIONS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Durations recorded by earlier runs, loaded once at import
+_previous_durations = _load_durations()
+
+
+def _save_durations():
+    """Merge this run's passing durations into the durations cache."""
+    if not _recorded_durations:
+        return
+    durations = {**_load_durations(), **_recorded_durations}
+    try:
+        with open(DURATIONS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"⚠️  Could not save test durations: {e}")
+
+
+def _batch_timeout(test_files):
+    """Deadline for a batch: three times its previous duration, within [MIN_TIMEOUT, DEFAULT_TIMEOUT].
+    
+    Files with no recorded history get the full DEFAULT_TIMEOUT.
+    """
+    previous = [_previous_durations.get(_duration_key(test_file)) for test_file in test_files]
+    if None in previous:
+        return DEFAULT_TIMEOUT
+    return min(DEFAULT_TIMEOUT, max(MIN_TIMEOUT, int(3 * sum(previous))))
+
+
+def _parse_junit_by_file(junit_path):
+    """Aggregate a JUnit XML report into {resolved test file: (success, duration)}."""
+    try:
+        root = ET.parse(junit_path).getroot()
+    except ET.ParseError:
+        # An interrupted run (e.g. a timeout) leaves no report behind
+        return {}
+    
+    per_file = {}
+    for case in root.iter("testcase"):
+        file_name = case.get("file")
+        if not file_name:
+            continue
+        test_file = os.path.realpath(os.path.join(PROJECT_ROOT_STR, file_name))
+        passed = case.find("failure") is None and case.find("error") is None
+        prev_passed, prev_duration = per_file.get(test_file, (True, 0))
+        per_file[test_file] = (prev_passed and passed, prev_duration + float(case.get("time", 0)))
+    
+    return per_file
+
+
+def run_cli_tests(use_xdist=True, isolated=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Run CLI-specific tests."""
+    print(f"\n{'='*60}")
+    print("Running CLI TESTS")
+    print(f"{'='*60}")
+    
+    cli_tests = [
+        ("tests/unit/test_cli.py", "CLI Unit"),
+        ("tests/functional/test_cli_integration.py", "CLI Integration"),
+        ("tests/stress/test_stress_performance.py", "CLI Stress")
+    ]
+    
+    return run_test_group(cli_tests, "CLI", use_xdist, isolated, batch_size)
+
+
+def run_core_tests(use_xdist=True, isolated=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Run core module tests."""
+    print(f"\n{'='*60}")
+    print("Running CORE MODULE TESTS")
+    print(f"{'='*60}")
+    
+    core_tests = [
+        ("tests/unit/test_config_handler.py", "Config Handler"),
+        ("tests/unit/test_image_analyzer.py", "Image Analyzer"),
+        ("tests/unit/test_imports.py", "Imports")
+    ]
+    
+    return run_test_group(core_tests, "Core Modules", use_xdist, isolated, batch_size)
+
+
+def run_web_dashboard_tests(use_xdist=True, isolated=False):
+    """Run web dashboard tests."""
+    print(f"\n{'='*60}")
+    print("Running WEB DASHBOARD TESTS")
+    print(f"{'='*60}")
+    
+    web_tests = [
+        ("web_dashboard/__tests__", "Web Dashboard Unit"),
+        ("web_dashboard/e2e", "Web Dashboard E2E")
+    ]
+    
+    results = []
+    
+    for test_path, test_name in web_tests:
+        resolved = os.path.join(PROJECT_ROOT_STR, test_path)
+        if os.path.exists(resolved):
+            success, duration = run_tests_with_pytest([resolved], test_name, use_xdist, isolated)
+            results.append(TestResult(test_name, _status(success), duration))
+        else:
+            print(f"⚠️  Test directory not found: {test_path}")
+            results.append(TestResult(test_name, Status.WARN, 0))
+    
+    return results
+
+
+def run_stress_tests(use_xdist=True, isolated=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Run stress and performance tests."""
+    print(f"\n{'='*60}")
+    print("Running STRESS AND PERFORMANCE TESTS")
+    print(f"{'='*60}")
+    
+    stress_tests = [
+        ("tests/stress", "Stress Tests")
+    ]
+    
+    return run_test_group(stress_tests, "Stress", use_xdist, isolated, batch_size)
+
+
+def run_quick_tests():
+    """Import the core modules in-process as a smoke check; return True if all import."""
+    print(f"\n{'='*60}")
+    print("Running QUICK IMPORT CHECK")
+    print(f"{'='*60}")
+    
+    failures = []
+    for module_name in QUICK_CHECK_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            failures.append(module_name)
+            print(f"❌ {module_name}: {e}")
+    
+    if not failures:
+        print(f"✅ All {len(QUICK_CHECK_MODULES)} core modules imported")
+    
+    return not failures
+
+
+def generate_test_report(all_results):
+    """Generate a comprehensive test report."""
+    # Built in memory and written in one go rather than line by line
+    report = io.StringIO()
+    print(f"\n{'='*80}", file=report)
+    print("COMPREHENSIVE TEST REPORT", file=report)
+    print(f"{'='*80}", file=report)
+    
+    total_tests = len(all_results)
+    counts = Counter(result.status for result in all_results)
+    passed_tests = counts[Status.PASS]
+    failed_tests = counts[Status.FAIL]
+    total_duration = sum(result.duration for result in all_results)
+    
+    print(f"Test Run: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=report)
+    print(f"Total Test Suites: {total_tests}", file=report)
+    print(f"Passed: {passed_tests}", file=report)
+    print(f"Failed: {failed_tests}", file=report)
+    print(f"Warnings: {counts[Status.WARN]}", file=report)
+    print(f"Success Rate: {(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "N/A", file=report)
+    print(f"Total Duration: {total_duration:.2f} seconds", file=report)
+    print(file=report)
+    
+    print("DETAILED RESULTS:", file=report)
+    print("-" * 80, file=report)
+    
+    for result in all_results:
+        status = STATUS_LABELS[result.status]
+        print(f"{status:<10} {result.name:<30} {result.duration:>8.2f}s", file=report)
+    
+    print(file=report)
+    
+    if failed_tests > 0:
+        print("FAILED TESTS:", file=report)
+        print("-" * 40, file=report)
+        for result in all_results:
+            if result.status == Status.FAIL:
+                print(f"❌ {result.name}", file=report)
+    
+    print(f"\n{'='*80}", file=report)
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
+    
+    # Optional suites that could not be run are reported but do not fail the run
+    return failed_tests == 0
+
+
+def run_comprehensive_tests(use_xdist=True, isolated=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Run every test group and return an exit code.
+    
+    Each group runs through pytest-xdist when available, otherwise unittest,
+    or pytest subprocesses when isolated.
+    """
+    print("🚀 Starting Comprehensive Test Suite for Forge API Tool")
+    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Python: {sys.version}")
+    print(f"Working Directory: {os.getcwd()}")
+    
+    # Fail fast on a broken environment before spawning the full suite
+    if not run_quick_tests():
+        print("💥 Quick import check failed; skipping the full test suite")
+        return 1
+    
+    all_results = []
+    
+    # Run CLI tests
+    cli_results = run_cli_tests(use_xdist, isolated, batch_size)
+    all_results.extend(cli_results)
+    
+    # Run core module tests
+    core_results = run_core_tests(use_xdist, isolated, batch_size)
+    all_results.extend(core_results)
+    
+    # Run web dashboard tests
+    web_results = run_web_dashboard_tests(use_xdist, isolated)
+    all_results.extend(web_results)
+    
+    # Run stress tests
+    stress_results = run_stress_tests(use_xdist, isolated, batch_size)
+    all_results.extend(stress_results)
+    
+    _save_durations()
+    
+    # Generate report
+    overall_success = generate_test_report(all_results)
+    
+    # Return appropriate exit code
+    if overall_success:
+        print("🎉 All tests passed!")
+        return 0
+    else:
+        print("💥 Some tests failed!")
+        return 1
+
+
+def main(argv=None):
+    """Parse the command line, run the selected tests and return an exit code."""
     parser = argparse.ArgumentParser(description='Run Forge API Tool tests')
-    parser.add_argument('--category', '-c', choices=['unit'], 
+    parser.add_argument('--category', '-c', choices=list(CATEGORY_KEYS), 
                        help='Run tests from a specific category')
     parser.add_argument('--test', '-t', help='Run a specific test')
+    parser.add_argument('--categories',
+                       help=f"Comma-separated categories to run ({','.join(CATEGORY_KEYS)})")
+    parser.add_argument('--list', '-l', action='store_true',
+                       help='List collected tests without running them')
+    parser.add_argument('--comprehensive', action='store_true',
+                       help='Run every test group (CLI, core, web dashboard, stress) through pytest-xdist '
+                            'when available, otherwise unittest, or pytest subprocesses with --isolated')
+    parser.add_argument('--no-xdist', action='store_true',
+                       help='Comprehensive run: run each suite serially instead of one parallel pytest run per group')
+    parser.add_argument('--isolated', action='store_true',
+                       help='Comprehensive run: run every pytest invocation in its own subprocess')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                       help='Comprehensive run: test files per subprocess when isolated (1 isolates every file)')
+    parser.add_argument('--failed-first', action='store_true',
+                       help='Comprehensive run: run tests that failed last time first (pytest --ff)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
     
-    if args.test:
-        exit_code = run_specific_test(args.test)
+    categories = None
+    if args.categories:
+        categories = [name.strip() for name in args.categories.split(',') if name.strip()]
+        unknown = [name for name in categories if name not in CATEGORY_KEYS]
+        if unknown:
+            parser.error(f"Unknown categories: {', '.join(unknown)}")
+    
+    _pytest_order_args[:] = ['--ff'] if args.failed_first else []
+    
+    if args.list:
+        return list_tests()
+    elif args.comprehensive:
+        return run_comprehensive_tests(not args.no_xdist, args.isolated, args.batch_size)
+    elif args.test:
+        return run_specific_test(args.test)
     elif args.category:
-        exit_code = run_specific_category(args.category)
+        return run_specific_category(args.category)
     else:
-        exit_code = run_all_tests()
-    
-    sys.exit(exit_code) 
\ No newline at end of file
+        return run_all_tests(categories)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
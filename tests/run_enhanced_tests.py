@@ -5,25 +5,272 @@ Incorporates all testing methods: unit, integration, functional, stress,
 property-based, security, performance regression, and more.
 """
 
+import io
 import os
+import math
+import asyncio
 import sys
+import signal
 import time
 import json
+import argparse
+import threading
 import subprocess
+import tempfile
+import multiprocessing
+import re
+import ast
+import hashlib
+import functools
 import unittest
+import importlib.util
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple, Any
 
+import pytest
+
+# orjson is optional; it serializes the detailed results much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the project root to the path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+# Interpreter used for tool subprocesses
+PYTHON = sys.executable
+
+# pytest-xdist is optional; when installed, the concurrently running categories share
+# this many workers between them, leaving two cores free for the rest of the machine
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+XDIST_WORKERS = max(1, (os.cpu_count() or 2) - 2)
+
+# pytest-timeout is optional; when installed it fails any single test running past
+# TEST_TIMEOUT seconds. Either way a category's worker process, with its xdist workers,
+# is stopped after TEST_TIMEOUT seconds per file plus CATEGORY_TIMEOUT_MARGIN, so one
+# slow test never costs the other files their results
+TIMEOUT_PLUGIN_AVAILABLE = importlib.util.find_spec("pytest_timeout") is not None
+TEST_TIMEOUT = 300
+CATEGORY_TIMEOUT_MARGIN = 60
+
+# pytest runs in worker processes forked from a server that has already imported
+# it, so the import is paid once; platforms without forkserver spawn workers instead
+if 'forkserver' in multiprocessing.get_all_start_methods():
+    _MP_CONTEXT = multiprocessing.get_context('forkserver')
+    _MP_CONTEXT.set_forkserver_preload(['pytest'])
+else:
+    _MP_CONTEXT = multiprocessing.get_context('spawn')
+
+
+def _pytest_worker(pytest_args: List[str], log_path: str):
+    """Run pytest.main in a worker process, sending its output to log_path."""
+    # Lead a process group of our own, so a timeout can kill the xdist workers too
+    if sys.platform != 'win32':
+        os.setsid()
+    with open(log_path, 'w') as log:
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        sys.stdout = sys.stderr = log
+        exit_code = pytest.main(pytest_args)
+        log.flush()
+    sys.exit(int(exit_code))
+
+
+@functools.lru_cache(maxsize=None)
+def _path_exists(path: str) -> bool:
+    """os.path.exists, memoized so each path is stat'ed once per run."""
+    return os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(path: str) -> str:
+    """os.path.realpath, memoized since resolving walks the filesystem."""
+    return os.path.realpath(path)
+
+
+def _kill_worker(worker):
+    """Kill a pytest worker process together with any processes it started."""
+    if sys.platform == 'win32':
+        worker.terminate()
+        return
+    
+    try:
+        os.killpg(worker.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _read_tail(path: Path, chars: int) -> str:
+    """Return roughly the last chars characters of a log file without reading all of it."""
+    with open(path, 'rb') as log:
+        log.seek(0, os.SEEK_END)
+        log.seek(max(0, log.tell() - chars))
+        return log.read().decode(errors='replace')
+
+
+def _parse_junit_report(junit_path: str) -> Dict[str, Dict[str, Any]]:
+    """Aggregate a JUnit XML report into per-file success, duration and failure output."""
+    try:
+        root = ET.parse(junit_path).getroot()
+    except ET.ParseError:
+        # An interrupted run (e.g. a timeout) leaves no report behind
+        return {}
+    
+    per_file = {}
+    for case in root.iter('testcase'):
+        file_name = case.get('file')
+        if not file_name:
+            continue
+        
+        entry = per_file.setdefault(
+            _resolve(os.path.join(project_root, file_name)),
+            {'success': True, 'duration': 0.0, 'output': []}
+        )
+        entry['duration'] += float(case.get('time', 0))
+        for problem in (case.find('failure'), case.find('error')):
+            if problem is not None:
+                entry['success'] = False
+                entry['output'].append(f"{case.get('classname')}.{case.get('name')}\n{problem.text or ''}")
+    
+    return per_file
+
+
+# Test files per pytest-backed category; a file listed under several categories
+# is only scheduled under the first
+TEST_FILES = {
+    'unit_tests': [
+        'tests/unit/test_cli.py',
+        'tests/unit/test_config_handler.py',
+        'tests/unit/test_wildcard_manager.py',
+        'tests/unit/test_output_manager.py',
+        'tests/unit/test_image_analyzer.py',
+        'tests/unit/test_imports.py',
+        'tests/unit/test_wildcard_randomization.py'
+    ],
+    'integration_tests': [
+        'tests/functional/test_cli_integration.py'
+    ],
+    'functional_tests': [
+        'tests/functional/test_cli_integration.py'
+    ],
+    'stress_tests': [
+        'tests/stress/test_stress_performance.py'
+    ],
+    'property_tests': [
+        'tests/property/test_properties.py'
+    ],
+    'security_tests': [
+        'tests/security/test_security.py'
+    ],
+    'performance_tests': [
+        'tests/performance/test_regression.py'
+    ]
+}
+
+# mutmut summary lines, e.g. "42 mutations killed" and "50 mutations total"
+_MUTMUT_KILLED_RE = re.compile(r'\s*(\d+)\b.*\bmutations\b.*\bkilled\b', re.IGNORECASE)
+_MUTMUT_TOTAL_RE = re.compile(r'\s*(\d+)\b.*\bmutations\b.*\btotal\b', re.IGNORECASE)
+
+# Fingerprints and durations of files that passed, so unchanged files are not re-run
+# with --cache; the fingerprint only sees the file and the project modules it imports
+# directly, so changes elsewhere (conftest, dependencies) still need a full run
+PASS_CACHE_FILE = Path(project_root) / 'tests' / '.cache' / 'last_pass.json'
+
+
+def _file_fingerprint(test_file: str) -> str:
+    """Fingerprint a test file by its content and the mtimes of the project modules it imports."""
+    with open(test_file, 'rb') as f:
+        source = f.read()
+    
+    digest = hashlib.sha1(source)
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return digest.hexdigest()
+    
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module)
+    
+    for module in sorted(modules):
+        base = os.path.join(project_root, *module.split('.'))
+        for candidate in (base + '.py', os.path.join(base, '__init__.py')):
+            if os.path.isfile(candidate):
+                digest.update(f"{module}:{os.stat(candidate).st_mtime_ns}".encode())
+                break
+    
+    return digest.hexdigest()
+
+
+# pytest output is written to log files here; results keep only the log path and
+# the last OUTPUT_TAIL_CHARS characters of the relevant output
+LOGS_DIR = Path(project_root) / 'tests' / '.logs'
+OUTPUT_TAIL_CHARS = 8 * 1024
+_LOG_NAME_RE = re.compile(r'[^\w.-]')
+
+# Load test target and shape; point FORGE_LOAD_TEST_URL at a running dashboard
+LOAD_TEST_URL = os.environ.get('FORGE_LOAD_TEST_URL', 'http://localhost:4000/api/status')
+LOAD_TEST_REQUESTS = 100
+LOAD_TEST_CONCURRENCY = 10
+
+# Seconds allowed per load test request, and for the reachability probe before them
+LOAD_TEST_TIMEOUT = 30
+LOAD_TEST_PROBE_TIMEOUT = 5
+
+
+class _RunningStats:
+    """Running mean and standard deviation (Welford's method) without keeping the samples."""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class _ThreadOutput:
+    """Stand-in for sys.stdout that lets each worker thread capture its own prints."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer):
+        """Send this thread's output to buffer (None restores the real stream)."""
+        self._local.buffer = buffer
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
 
 class EnhancedTestRunner:
     """Enhanced test runner with comprehensive testing capabilities."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = False):
         """Initialize the enhanced test runner."""
         self.results = {
             'unit_tests': [],
@@ -37,13 +284,36 @@ class EnhancedTestRunner:
             'accessibility_tests': [],
             'load_tests': []
         }
-        self.start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
         self.test_stats = {
             'total_tests': 0,
             'passed_tests': 0,
             'failed_tests': 0,
             'skipped_tests': 0,
-            'total_duration': 0
+            'total_duration': 0,
+            # Per-category tallies kept up to date as results are added
+            'by_category': {}
+        }
+        # Guards self.results while categories run concurrently
+        self._lock = threading.Lock()
+        
+        # Schedule each test file once, under the first category that lists it
+        self.test_files = {}
+        scheduled = set()
+        for category, test_files in TEST_FILES.items():
+            self.test_files[category] = [f for f in test_files if f not in scheduled]
+            scheduled.update(test_files)
+        
+        # xdist workers per category while categories run concurrently
+        self._xdist_workers = XDIST_WORKERS
+        
+        self.use_cache = use_cache
+        self._pass_cache = self._load_pass_cache() if use_cache else {}
+        
+        # Optional tools behind the tool-driven categories, probed without importing them
+        self._available = {
+            module: importlib.util.find_spec(module) is not None
+            for module in ('mutmut', 'axe_selenium_python', 'aiohttp')
         }
     
     def run_all_tests(self) -> bool:
@@ -54,314 +324,433 @@ class EnhancedTestRunner:
         print(f"Working Directory: {os.getcwd()}")
         print("=" * 80)
         
-        # Run all test categories
+        # pytest-backed categories, run concurrently with each other
         test_categories = [
             ('Unit Tests', self.run_unit_tests),
             ('Integration Tests', self.run_integration_tests),
             ('Functional Tests', self.run_functional_tests),
-            ('Stress Tests', self.run_stress_tests),
             ('Property-Based Tests', self.run_property_tests),
-            ('Security Tests', self.run_security_tests),
-            ('Performance Tests', self.run_performance_tests),
-            ('Mutation Tests', self.run_mutation_tests),
-            ('Accessibility Tests', self.run_accessibility_tests),
-            ('Load Tests', self.run_load_tests)
+            ('Security Tests', self.run_security_tests)
+        ]
+        
+        # These assert on wall-clock thresholds, so they run afterwards, one at a
+        # time and without xdist, with the machine to themselves
+        timed_categories = [
+            ('Stress Tests', self.run_stress_tests),
+            ('Performance Tests', self.run_performance_tests)
+        ]
+        
+        # Tool-driven categories contend for the same cores, so they run one at a time
+        tool_categories = [
+            ('Mutation Tests', self.run_mutation_tests, 'mutmut'),
+            ('Accessibility Tests', self.run_accessibility_tests, 'axe_selenium_python'),
+            ('Load Tests', self.run_load_tests, 'aiohttp')
+        ]
+        
+        # Categories whose tool is not installed are dropped before anything is scheduled
+        for category_name, _, module in tool_categories:
+            if not self._available[module]:
+                print(f"⚠️  {module} not available, skipping {category_name.lower()}")
+        tool_categories = [
+            (category_name, test_function)
+            for category_name, test_function, module in tool_categories
+            if self._available[module]
         ]
         
         overall_success = True
         
-        for category_name, test_function in test_categories:
+        # Each category's output is collected and printed as one block when it finishes
+        console = sys.stdout
+        sys.stdout = _ThreadOutput(console)
+        try:
+            # The concurrent categories split one xdist worker budget between them
+            workers = min(len(test_categories), os.cpu_count() or 4)
+            self._xdist_workers = max(1, XDIST_WORKERS // len(test_categories))
+            with ThreadPoolExecutor(max_workers=workers) as test_pool, \
+                    ThreadPoolExecutor(max_workers=1) as tool_pool:
+                futures = [test_pool.submit(self._run_category, *category) for category in test_categories]
+                futures += [tool_pool.submit(self._run_category, *category) for category in tool_categories]
+                
+                for future in as_completed(futures):
+                    success, output = future.result()
+                    console.write(output)
+                    overall_success = overall_success and success
+            
+            for category in timed_categories:
+                success, output = self._run_category(*category)
+                console.write(output)
+                overall_success = overall_success and success
+        finally:
+            sys.stdout = console
+        
+        if self.use_cache:
+            self._save_pass_cache()
+        
+        # Generate comprehensive report
+        self.generate_enhanced_report()
+        
+        return overall_success
+    
+    def _run_category(self, category_name: str, test_function) -> Tuple[bool, str]:
+        """Run one test category with its output captured; return (success, output)."""
+        buffer = io.StringIO()
+        sys.stdout.capture(buffer)
+        try:
             print(f"\n{'='*60}")
             print(f"Running {category_name.upper()}")
             print(f"{'='*60}")
             
             try:
                 success = test_function()
-                if not success:
-                    overall_success = False
             except Exception as e:
                 print(f"❌ Error running {category_name}: {e}")
-                overall_success = False
+                success = False
+        finally:
+            sys.stdout.capture(None)
         
-        # Generate comprehensive report
-        self.generate_enhanced_report()
-        
-        return overall_success
+        return success, buffer.getvalue()
     
     def run_unit_tests(self) -> bool:
         """Run unit tests."""
-        unit_test_files = [
-            'tests/unit/test_cli.py',
-            'tests/unit/test_config_handler.py',
-            'tests/unit/test_wildcard_manager.py',
-            'tests/unit/test_output_manager.py',
-            'tests/unit/test_image_analyzer.py',
-            'tests/unit/test_imports.py',
-            'tests/unit/test_wildcard_randomization.py'
-        ]
-        
-        return self._run_test_files(unit_test_files, 'unit_tests')
+        return self._run_test_files(self.test_files['unit_tests'], 'unit_tests')
     
     def run_integration_tests(self) -> bool:
         """Run integration tests."""
-        integration_test_files = [
-            'tests/functional/test_cli_integration.py'
-        ]
-        
-        return self._run_test_files(integration_test_files, 'integration_tests')
+        return self._run_test_files(self.test_files['integration_tests'], 'integration_tests')
     
     def run_functional_tests(self) -> bool:
         """Run functional tests."""
-        functional_test_files = [
-            'tests/functional/test_cli_integration.py'
-        ]
-        
-        return self._run_test_files(functional_test_files, 'functional_tests')
+        return self._run_test_files(self.test_files['functional_tests'], 'functional_tests')
     
     def run_stress_tests(self) -> bool:
         """Run stress tests."""
-        stress_test_files = [
-            'tests/stress/test_stress_performance.py'
-        ]
-        
-        return self._run_test_files(stress_test_files, 'stress_tests')
+        return self._run_test_files(self.test_files['stress_tests'], 'stress_tests', use_xdist=False)
     
     def run_property_tests(self) -> bool:
         """Run property-based tests."""
-        property_test_files = [
-            'tests/property/test_properties.py'
-        ]
-        
-        return self._run_test_files(property_test_files, 'property_tests')
+        return self._run_test_files(self.test_files['property_tests'], 'property_tests')
     
     def run_security_tests(self) -> bool:
         """Run security tests."""
-        security_test_files = [
-            'tests/security/test_security.py'
-        ]
-        
-        return self._run_test_files(security_test_files, 'security_tests')
+        return self._run_test_files(self.test_files['security_tests'], 'security_tests')
     
     def run_performance_tests(self) -> bool:
         """Run performance regression tests."""
-        performance_test_files = [
-            'tests/performance/test_regression.py'
-        ]
-        
-        return self._run_test_files(performance_test_files, 'performance_tests')
+        return self._run_test_files(self.test_files['performance_tests'], 'performance_tests', use_xdist=False)
     
     def run_mutation_tests(self) -> bool:
         """Run mutation tests."""
         print("🔄 Running mutation tests...")
         
-        try:
-            # Check if mutmut is available
-            import mutmut
-            print("✅ mutmut is available")
-            
-            # Run mutation tests on core modules
-            core_modules = [
-                'core/config_handler.py',
-                'core/wildcard_manager.py',
-                'core/output_manager.py',
-                'core/image_analyzer.py'
-            ]
-            
-            mutation_results = []
-            for module in core_modules:
-                if os.path.exists(module):
-                    print(f"Testing mutations in {module}...")
-                    result = self._run_mutation_test(module)
-                    mutation_results.append({
-                        'module': module,
-                        'success': result.get('success', False),
-                        'total': result.get('total', 0),
-                        'killed': result.get('killed', 0),
-                        'survived': result.get('survived', 0)
-                    })
-            
-            self.results['mutation_tests'] = mutation_results
-            
-            # Calculate mutation score
-            total_mutations = sum(result['total'] for result in mutation_results)
-            killed_mutations = sum(result['killed'] for result in mutation_results)
-            
-            if total_mutations > 0:
-                mutation_score = (killed_mutations / total_mutations) * 100
-                print(f"Mutation Score: {mutation_score:.1f}% ({killed_mutations}/{total_mutations})")
-                
-                # Consider test successful if mutation score is above 80%
-                return mutation_score >= 80
-            else:
-                print("No mutations found to test")
-                return True
-                
-        except ImportError:
+        if not self._available['mutmut']:
             print("⚠️  mutmut not available, skipping mutation tests")
             print("Install with: pip install mutmut")
             return True
+        
+        print("✅ mutmut is available")
+        
+        # Run mutation tests on core modules
+        core_modules = [
+            'core/config_handler.py',
+            'core/wildcard_manager.py',
+            'core/output_manager.py',
+            'core/image_analyzer.py'
+        ]
+        
+        mutation_results = []
+        for module in core_modules:
+            if _path_exists(module):
+                print(f"Testing mutations in {module}...")
+                result = self._run_mutation_test(module)
+                mutation_results.append({
+                    'module': module,
+                    'success': result.get('success', False),
+                    'total': result.get('total', 0),
+                    'killed': result.get('killed', 0),
+                    'survived': result.get('survived', 0)
+                })
+        
+        self._start_category('mutation_tests')
+        for result in mutation_results:
+            self._add_result('mutation_tests', result)
+        
+        # Calculate mutation score
+        total_mutations = sum(result['total'] for result in mutation_results)
+        killed_mutations = sum(result['killed'] for result in mutation_results)
+        
+        if total_mutations > 0:
+            mutation_score = (killed_mutations / total_mutations) * 100
+            print(f"Mutation Score: {mutation_score:.1f}% ({killed_mutations}/{total_mutations})")
+            
+            # Consider test successful if mutation score is above 80%
+            return mutation_score >= 80
+        else:
+            print("No mutations found to test")
+            return True
     
     def run_accessibility_tests(self) -> bool:
         """Run accessibility tests."""
         print("♿ Running accessibility tests...")
         
-        try:
-            # Check if accessibility testing tools are available
-            import axe_selenium_python
-            print("✅ axe-selenium-python is available")
-            
-            # Run accessibility tests
-            accessibility_results = self._run_accessibility_tests()
-            self.results['accessibility_tests'] = accessibility_results
-            
-            # Check for violations
-            total_violations = sum(len(result.get('violations', [])) for result in accessibility_results)
-            
-            if total_violations == 0:
-                print("✅ No accessibility violations found")
-                return True
-            else:
-                print(f"⚠️  Found {total_violations} accessibility violations")
-                return False
-                
-        except ImportError:
+        if not self._available['axe_selenium_python']:
             print("⚠️  axe-selenium-python not available, skipping accessibility tests")
             print("Install with: pip install axe-selenium-python")
             return True
+        
+        print("✅ axe-selenium-python is available")
+        
+        # Run accessibility tests
+        accessibility_results = self._run_accessibility_tests()
+        self._start_category('accessibility_tests')
+        for result in accessibility_results:
+            self._add_result('accessibility_tests', result)
+        
+        # Check for violations
+        total_violations = sum(len(result.get('violations', [])) for result in accessibility_results)
+        
+        if total_violations == 0:
+            print("✅ No accessibility violations found")
+            return True
+        else:
+            print(f"⚠️  Found {total_violations} accessibility violations")
+            return False
     
     def run_load_tests(self) -> bool:
         """Run load tests."""
         print("⚡ Running load tests...")
         
-        try:
-            # Check if load testing tools are available
-            import aiohttp
-            print("✅ aiohttp is available")
-            
-            # Run load tests
-            load_results = self._run_load_tests()
-            self.results['load_tests'] = load_results
-            
-            # Check if load tests passed
-            success_rate = load_results.get('success_rate', 0)
-            response_time = load_results.get('avg_response_time', 0)
-            
-            print(f"Load Test Results: {success_rate:.1f}% success rate, {response_time:.2f}s avg response time")
-            
-            # Consider test successful if success rate is above 90% and response time is reasonable
-            return success_rate >= 90 and response_time <= 5.0
-            
-        except ImportError:
+        if not self._available['aiohttp']:
             print("⚠️  aiohttp not available, skipping load tests")
             print("Install with: pip install aiohttp")
             return True
-    
-    def _run_test_files(self, test_files: List[str], category: str) -> bool:
-        """Run a list of test files."""
-        results = []
-        overall_success = True
         
+        print("✅ aiohttp is available")
+        
+        # Run load tests
+        load_results = self._run_load_tests()
+        with self._lock:
+            self.results['load_tests'] = load_results
+        
+        if load_results.get('skipped'):
+            return True
+        
+        # Check if load tests passed
+        success_rate = load_results.get('success_rate', 0)
+        response_time = load_results.get('avg_response_time', 0)
+        
+        print(f"Load Test Results: {success_rate:.1f}% success rate, {response_time:.2f}s avg response time")
+        
+        # Consider test successful if success rate is above 90% and response time is reasonable
+        return success_rate >= 90 and response_time <= 5.0
+    
+    def _start_category(self, category: str):
+        """Clear a category's results and tallies before it (re)runs."""
+        with self._lock:
+            self.results[category] = []
+            self.test_stats['by_category'][category] = {'passed': 0, 'failed': 0, 'duration': 0.0}
+    
+    def _add_result(self, category: str, result: Dict[str, Any]):
+        """Append a result dict to a category and update its tallies."""
+        with self._lock:
+            self.results[category].append(result)
+            stats = self.test_stats['by_category'][category]
+            stats['passed' if result.get('success', False) else 'failed'] += 1
+            stats['duration'] += result.get('duration', 0)
+    
+    def _load_pass_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the fingerprints of files that passed in earlier runs."""
+        try:
+            with open(PASS_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_pass_cache(self):
+        """Save the fingerprints of files that passed."""
+        PASS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(PASS_CACHE_FILE, 'w') as f:
+            json.dump(self._pass_cache, f, indent=2)
+    
+    def _run_test_files(self, test_files: List[str], category: str, use_xdist: bool = True) -> bool:
+        """Run a list of test files in one pytest invocation, spread across cores with xdist."""
+        existing, missing = [], []
         for test_file in test_files:
-            if os.path.exists(test_file):
-                print(f"Running {test_file}...")
-                start_time = time.time()
+            (existing if _path_exists(test_file) else missing).append(test_file)
+        
+        # Missing files are reported straight away, without going near pytest
+        self._start_category(category)
+        for test_file in missing:
+            print(f"⚠️  Test file not found: {test_file}")
+            self._add_result(category, {
+                'file': test_file,
+                'success': False,
+                'duration': 0,
+                'return_code': -1,
+                'log': None,
+                'output_tail': 'File not found'
+            })
+        
+        # Files unchanged since they last passed are reported from the cache;
+        # fingerprinting parses every file, so it is skipped when the cache is off
+        fingerprints = {}
+        cached = {}
+        if self.use_cache:
+            fingerprints = {test_file: _file_fingerprint(test_file) for test_file in existing}
+            for test_file in existing:
+                entry = self._pass_cache.get(os.path.abspath(test_file))
+                if entry and entry.get('fingerprint') == fingerprints[test_file]:
+                    cached[test_file] = entry
+        to_run = [test_file for test_file in existing if test_file not in cached]
+        
+        per_file = {}
+        return_code = -1
+        run_error = ''
+        
+        # pytest output goes to log files rather than into the results
+        log_dir = LOGS_DIR / category
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = log_dir / 'pytest.log'
+        
+        if to_run:
+            print(f"Running {', '.join(to_run)}...")
+            fd, junit_path = tempfile.mkstemp(suffix='.xml')
+            os.close(fd)
+            
+            pytest_args = [
+                *(os.path.abspath(test_file) for test_file in to_run), "-v", "--tb=short",
+                f"--rootdir={project_root}",
+                f"--junitxml={junit_path}",
+                "-o", "junit_family=xunit1"
+            ]
+            if use_xdist and XDIST_AVAILABLE:
+                pytest_args += ["-n", str(self._xdist_workers), "--dist=loadfile"]
+            if TIMEOUT_PLUGIN_AVAILABLE:
+                pytest_args.append(f"--timeout={TEST_TIMEOUT}")
+            
+            deadline = TEST_TIMEOUT * len(to_run) + CATEGORY_TIMEOUT_MARGIN
+            try:
+                worker = _MP_CONTEXT.Process(target=_pytest_worker, args=(pytest_args, str(log_path)))
+                worker.start()
+                worker.join(deadline)
                 
-                try:
-                    # Run test file
-                    result = subprocess.run(
-                        [sys.executable, "-m", "pytest", test_file, "-v", "--tb=short"],
-                        capture_output=True,
-                        text=True,
-                        timeout=300  # 5 minute timeout
-                    )
-                    
-                    end_time = time.time()
-                    duration = end_time - start_time
-                    
-                    success = result.returncode == 0
-                    overall_success = overall_success and success
-                    
-                    results.append({
-                        'file': test_file,
-                        'success': success,
-                        'duration': duration,
-                        'return_code': result.returncode,
-                        'stdout': result.stdout,
-                        'stderr': result.stderr
-                    })
-                    
-                    status = "✅ PASS" if success else "❌ FAIL"
-                    print(f"{status} {test_file} ({duration:.2f}s)")
-                    
-                except subprocess.TimeoutExpired:
-                    print(f"⏰ TIMEOUT {test_file}")
-                    results.append({
-                        'file': test_file,
-                        'success': False,
-                        'duration': 300,
-                        'return_code': -1,
-                        'stdout': '',
-                        'stderr': 'Test timed out after 5 minutes'
-                    })
-                    overall_success = False
-                    
-                except Exception as e:
-                    print(f"❌ ERROR {test_file}: {e}")
-                    results.append({
-                        'file': test_file,
-                        'success': False,
-                        'duration': 0,
-                        'return_code': -1,
-                        'stdout': '',
-                        'stderr': str(e)
-                    })
-                    overall_success = False
-            else:
-                print(f"⚠️  Test file not found: {test_file}")
-                results.append({
+                if worker.is_alive():
+                    _kill_worker(worker)
+                    worker.join()
+                    print(f"⏰ TIMEOUT {category}")
+                    run_error = f'Test timed out after {deadline} seconds'
+                else:
+                    return_code = worker.exitcode
+                    run_error = _read_tail(log_path, OUTPUT_TAIL_CHARS)
+            except Exception as e:
+                print(f"❌ ERROR {category}: {e}")
+                run_error = str(e)
+            finally:
+                per_file = _parse_junit_report(junit_path)
+                os.remove(junit_path)
+        
+        overall_success = not missing
+        
+        for test_file in existing:
+            if test_file in cached:
+                duration = cached[test_file]['duration']
+                self._add_result(category, {
                     'file': test_file,
-                    'success': False,
-                    'duration': 0,
-                    'return_code': -1,
-                    'stdout': '',
-                    'stderr': 'File not found'
+                    'success': True,
+                    'duration': duration,
+                    'return_code': 0,
+                    'log': None,
+                    'output_tail': '',
+                    'cached': True
                 })
-                overall_success = False
+                print(f"✅ PASS {test_file} (cached, {duration:.2f}s)")
+                continue
+            
+            report = per_file.get(_resolve(test_file))
+            file_log, output_tail = log_path, ''
+            if report is not None:
+                success = report['success']
+                duration = report['duration']
+                if report['output']:
+                    # Failure details get a log of their own next to the full run log
+                    output = '\n'.join(report['output'])
+                    file_log = log_dir / (_LOG_NAME_RE.sub('_', test_file) + '.log')
+                    file_log.write_text(output, errors='replace')
+                    output_tail = output[-OUTPUT_TAIL_CHARS:]
+            else:
+                # No test cases reported for the file (collection error, timeout, ...)
+                success = return_code == 0
+                duration = 0
+                if not success:
+                    output_tail = run_error
+            
+            overall_success = overall_success and success
+            if self.use_cache and success and report is not None:
+                with self._lock:
+                    self._pass_cache[os.path.abspath(test_file)] = {
+                        'fingerprint': fingerprints[test_file],
+                        'duration': duration
+                    }
+            
+            self._add_result(category, {
+                'file': test_file,
+                'success': success,
+                'duration': duration,
+                'return_code': return_code,
+                'log': str(file_log),
+                'output_tail': output_tail
+            })
+            
+            status = "✅ PASS" if success else "❌ FAIL"
+            print(f"{status} {test_file} ({duration:.2f}s)")
         
-        self.results[category] = results
         return overall_success
     
     def _run_mutation_test(self, module: str) -> Dict[str, Any]:
         """Run mutation test on a module."""
         try:
-            # Run mutmut on the module
-            result = subprocess.run(
-                [sys.executable, "-m", "mutmut", "run", "--paths-to-mutate", module],
-                capture_output=True,
+            # Run mutmut on the module, streaming its output rather than buffering it
+            process = subprocess.Popen(
+                [PYTHON, "-m", "mutmut", "run", "--paths-to-mutate", module],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=600  # 10 minute timeout
+                bufsize=1
             )
+            deadline = threading.Timer(600, process.kill)  # 10 minute timeout
+            deadline.start()
             
-            # Parse mutmut output to extract statistics
-            output = result.stdout + result.stderr
+            # Extract mutation statistics line by line
+            total_mutations = None
+            killed_mutations = None
             
-            # Extract mutation statistics
-            total_mutations = 0
-            killed_mutations = 0
+            try:
+                for line in process.stdout:
+                    match = _MUTMUT_KILLED_RE.match(line)
+                    if match:
+                        killed_mutations = int(match.group(1))
+                    else:
+                        match = _MUTMUT_TOTAL_RE.match(line)
+                        if match:
+                            total_mutations = int(match.group(1))
+                    
+                    # Both statistics known; the rest of the output is not needed
+                    if total_mutations is not None and killed_mutations is not None:
+                        process.terminate()
+                        break
+                process.wait()
+            finally:
+                deadline.cancel()
+                process.stdout.close()
             
-            for line in output.split('\n'):
-                if 'mutations' in line.lower():
-                    # Parse mutation statistics
-                    if 'killed' in line.lower():
-                        killed_mutations = int(line.split()[0])
-                    elif 'total' in line.lower():
-                        total_mutations = int(line.split()[0])
+            complete = total_mutations is not None and killed_mutations is not None
+            total_mutations = total_mutations or 0
+            killed_mutations = killed_mutations or 0
             
             return {
                 'total': total_mutations,
                 'killed': killed_mutations,
                 'survived': total_mutations - killed_mutations,
-                'success': result.returncode == 0
+                'success': complete or process.returncode == 0
             }
             
         except Exception as e:
@@ -401,51 +790,70 @@ class EnhancedTestRunner:
     
     def _run_load_tests(self) -> Dict[str, Any]:
         """Run load tests."""
-        # This is a simplified version - in practice, you'd use aiohttp or locust
-        import time
-        import random
-        
-        # Simulate load testing
-        start_time = time.time()
+        return asyncio.run(self._run_load_tests_async())
+    
+    async def _run_load_tests_async(self) -> Dict[str, Any]:
+        """Send LOAD_TEST_REQUESTS requests to the dashboard, at most LOAD_TEST_CONCURRENCY at a time."""
+        import aiohttp
         
-        # Simulate 100 concurrent requests
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(LOAD_TEST_CONCURRENCY)
+        response_times = _RunningStats()
         successful_requests = 0
-        total_requests = 100
-        response_times = []
         
-        for i in range(total_requests):
-            # Simulate request processing time
-            response_time = random.uniform(0.1, 2.0)
-            response_times.append(response_time)
+        async def one_request(session):
+            nonlocal successful_requests
+            async with semaphore:
+                start = loop.time()
+                try:
+                    async with session.get(LOAD_TEST_URL) as response:
+                        await response.read()
+                        if response.status < 400:
+                            successful_requests += 1
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    pass  # Counted as a failed request
+                response_times.add(loop.time() - start)
+        
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=LOAD_TEST_TIMEOUT)) as session:
+            # Without a running, healthy dashboard there is nothing to load test
+            try:
+                probe_timeout = aiohttp.ClientTimeout(total=LOAD_TEST_PROBE_TIMEOUT)
+                async with session.get(LOAD_TEST_URL, timeout=probe_timeout) as response:
+                    await response.read()
+                    reachable = response.status < 400
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                reachable = False
             
-            # Simulate some failures
-            if random.random() > 0.05:  # 95% success rate
-                successful_requests += 1
+            if not reachable:
+                print(f"⚠️  Dashboard not reachable at {LOAD_TEST_URL}, skipping load tests")
+                return {'skipped': True, 'url': LOAD_TEST_URL}
             
-            time.sleep(0.01)  # Small delay to simulate real requests
-        
-        end_time = time.time()
-        total_time = end_time - start_time
+            start_time = loop.time()
+            await asyncio.gather(*(one_request(session) for _ in range(LOAD_TEST_REQUESTS)))
+            total_time = loop.time() - start_time
         
         return {
-            'total_requests': total_requests,
+            'url': LOAD_TEST_URL,
+            'total_requests': LOAD_TEST_REQUESTS,
             'successful_requests': successful_requests,
-            'failed_requests': total_requests - successful_requests,
-            'success_rate': (successful_requests / total_requests) * 100,
-            'avg_response_time': sum(response_times) / len(response_times),
+            'failed_requests': LOAD_TEST_REQUESTS - successful_requests,
+            'success_rate': (successful_requests / LOAD_TEST_REQUESTS) * 100,
+            'avg_response_time': response_times.mean,
+            'response_time_stddev': response_times.stddev,
             'total_time': total_time,
-            'requests_per_second': total_requests / total_time
+            'requests_per_second': LOAD_TEST_REQUESTS / total_time
         }
     
     def generate_enhanced_report(self):
         """Generate comprehensive test report."""
-        end_time = time.time()
-        total_duration = end_time - self.start_time
+        # One clock reading each, shared by the printed report and the saved results
+        report_time = datetime.now()
+        total_duration = (time.perf_counter_ns() - self._start_ns) / 1e9
         
         print(f"\n{'='*80}")
         print("ENHANCED TEST REPORT")
         print(f"{'='*80}")
-        print(f"Test Run: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Test Run: {report_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Total Duration: {total_duration:.2f} seconds")
         print()
         
@@ -454,11 +862,14 @@ class EnhancedTestRunner:
         passed_tests = 0
         failed_tests = 0
         
+        by_category = self.test_stats['by_category']
+        
         for category, results in self.results.items():
             if isinstance(results, list):
-                category_tests = len(results)
-                category_passed = sum(1 for r in results if isinstance(r, dict) and r.get('success', False))
-                category_failed = category_tests - category_passed
+                stats = by_category.get(category, {'passed': 0, 'failed': 0})
+                category_passed = stats['passed']
+                category_failed = stats['failed']
+                category_tests = category_passed + category_failed
                 
                 total_tests += category_tests
                 passed_tests += category_passed
@@ -482,28 +893,31 @@ class EnhancedTestRunner:
         print(f"Total Duration: {total_duration:.2f} seconds")
         
         # Save detailed results
-        self._save_detailed_results()
+        self._save_detailed_results(report_time, total_duration)
         
         # Print recommendations
         self._print_recommendations()
     
-    def _save_detailed_results(self):
+    def _save_detailed_results(self, report_time: datetime, total_duration: float):
         """Save detailed test results to file."""
         results_file = Path('tests/enhanced_test_results.json')
         results_file.parent.mkdir(exist_ok=True)
         
         detailed_results = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': report_time.isoformat(),
             'python_version': sys.version,
             'working_directory': os.getcwd(),
             'results': self.results,
             'summary': {
-                'total_duration': time.time() - self.start_time
+                'total_duration': total_duration
             }
         }
         
-        with open(results_file, 'w') as f:
-            json.dump(detailed_results, f, indent=2)
+        if orjson is not None:
+            results_file.write_bytes(orjson.dumps(detailed_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(detailed_results, f, indent=2)
         
         print(f"\nDetailed results saved to: {results_file}")
     
@@ -516,11 +930,10 @@ class EnhancedTestRunner:
         recommendations = []
         
         # Analyze results and provide recommendations
-        for category, results in self.results.items():
-            if isinstance(results, list):
-                failed_count = sum(1 for r in results if isinstance(r, dict) and not r.get('success', False))
-                if failed_count > 0:
-                    recommendations.append(f"Fix {failed_count} failed {category.replace('_', ' ')}")
+        for category, stats in self.test_stats['by_category'].items():
+            failed_count = stats['failed']
+            if failed_count > 0:
+                recommendations.append(f"Fix {failed_count} failed {category.replace('_', ' ')}")
         
         # Check for missing test types
         if not self.results.get('property_tests'):
@@ -550,7 +963,13 @@ class EnhancedTestRunner:
 
 def main():
     """Main function to run enhanced tests."""
-    runner = EnhancedTestRunner()
+    parser = argparse.ArgumentParser(description="Run the enhanced Forge API Tool test suite")
+    parser.add_argument("--cache", action="store_true",
+                        help="Skip test files unchanged since they last passed (only the file and "
+                             "its direct project imports are checked, so use for quick local re-runs)")
+    args = parser.parse_args()
+    
+    runner = EnhancedTestRunner(use_cache=args.cache)
     success = runner.run_all_tests()
     
     if success:
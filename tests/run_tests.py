@@ -4,27 +4,22 @@ Simple test runner for Forge API Tool.
 Delegates to the organized test suite in tests/run_all_tests.py
 """
 
+import os
 import sys
-import subprocess
-from pathlib import Path
+
+# Lets `python tests/run_tests.py` find run_all_tests from any working directory
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_all_tests import main as run_all_tests_main
 
 def main():
     """Run tests using the organized test suite."""
-    # Get the path to the test runner
-    test_runner = Path(__file__).parent / "tests" / "run_all_tests.py"
-    
-    if not test_runner.exists():
-        print("❌ Test runner not found at tests/run_all_tests.py")
-        sys.exit(1)
-    
     # Pass all arguments to the test runner
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     
     try:
-        # Run the test suite
-        result = subprocess.run([sys.executable, str(test_runner)] + args, 
-                              cwd=Path(__file__).parent)
-        sys.exit(result.returncode)
+        # Run the test suite in this interpreter instead of spawning another one
+        sys.exit(run_all_tests_main(args))
     except KeyboardInterrupt:
         print("\n⚠️  Tests interrupted by user")
         sys.exit(1)
@@ -33,4 +28,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
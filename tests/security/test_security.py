@@ -10,7 +10,7 @@ import tempfile
 import json
 import re
 import base64
-from pathlib import Path
+import urllib.parse
 from unittest.mock import patch, Mock
 
 # Add the project root to the path
@@ -18,97 +18,148 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 
 import pytest
-import requests
 from unittest import TestCase
 
 # Import core modules
 from core.config_handler import config_handler
 from core.wildcard_manager import WildcardManagerFactory
-from core.output_manager import OutputManager
 from core.exceptions import ValidationError
 
+# Basic auth header with made-up credentials
+_FAKE_BASIC_AUTH = 'Basic ' + base64.b64encode(b'fake:fake').decode()
+
+# Characters _validate_input rejects, along with null bytes
+_DANGEROUS_CHARS = ('<', '>', '"', "'", '&', '|', ';', '`', '$', '(', ')')
+_UNSAFE_INPUT_RE = re.compile('[%s]' % re.escape(''.join(('\x00',) + _DANGEROUS_CHARS)))
+
+# Event handler attributes stripped by _sanitize_input
+_EVENT_HANDLERS = ('onload', 'onerror', 'onfocus', 'ontoggle', 'onstart', 'onclick', 'onmouseover')
+
+# Translation table deleting the shell metacharacters _process_file_operation rejects
+_SHELL_CHARS_TABLE = str.maketrans('', '', ';&|`$()')
+
+# File extensions _upload_file refuses
+_DANGEROUS_EXTENSIONS = frozenset({'exe', 'bat', 'sh', 'py', 'php', 'jsp', 'asp'})
+
+# Longest input _sanitize_input will process
+MAX_SANITIZE_LENGTH = 64 * 1024
+
+# Longest string _process_large_input accepts
+MAX_LARGE_INPUT_LENGTH = 1024 * 1024
+
+# Patterns stripped by _sanitize_input, compiled once for every call
+_SANITIZE_PATTERNS = (
+    # Script blocks, unrolled so an unterminated <script> is matched in linear time
+    re.compile(r'<script\b[^>]*>[^<]*(?:<(?!/script>)[^<]*)*(?:</script>)?', re.IGNORECASE),
+    re.compile(r'javascript:', re.IGNORECASE),
+    # Event handlers in one alternation so the input is scanned once
+    re.compile(r'(?:%s)\s*=' % '|'.join(_EVENT_HANDLERS), re.IGNORECASE)
+)
+
+
+
+class _LengthOnlyBytes:
+    """Oversized upload payload that reports its length without allocating it."""
+    
+    __slots__ = ('size',)
+    
+    def __init__(self, size):
+        self.size = size
+    
+    def __len__(self):
+        return self.size
+
+
+def _canonicalize(path):
+    """Resolve '.' and '..' in a relative, possibly URL-encoded path, rejecting escapes."""
+    path = urllib.parse.unquote(path).replace('\\', '/')
+    if path.startswith('/') or re.match(r'[A-Za-z]:', path):
+        raise ValidationError("Absolute paths not allowed")
+    
+    stack = []
+    for part in path.split('/'):
+        if any(ord(char) < 32 for char in part):
+            raise ValidationError("Control characters not allowed in path")
+        if part in ('', '.'):
+            continue
+        if part == '..':
+            if not stack:
+                raise ValidationError("Path traversal not allowed")
+            stack.pop()
+        else:
+            stack.append(part)
+    
+    return '/'.join(stack)
+
 
 class TestSecurityVulnerabilities(TestCase):
     """Security vulnerability tests."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.temp_dir)
-        
-        # Create test directories
-        os.makedirs('configs', exist_ok=True)
-        os.makedirs('wildcards', exist_ok=True)
-        os.makedirs('outputs', exist_ok=True)
-        
-        # Initialize components
-        self.wildcard_factory = WildcardManagerFactory()
-        self.output_manager = OutputManager('outputs')
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
-    def test_sql_injection_prevention(self):
-        """Test SQL injection prevention."""
-        malicious_inputs = [
-            "'; DROP TABLE configs; --",
-            "' OR '1'='1",
-            "'; INSERT INTO configs VALUES ('hack', '{}'); --",
-            "'; UPDATE configs SET name='hacked'; --",
-            "'; DELETE FROM configs; --",
-            "'; EXEC xp_cmdshell('dir'); --",
-            "'; SELECT * FROM users WHERE id=1 OR '1'='1'; --"
-        ]
-        
-        for malicious_input in malicious_inputs:
-            with self.assertRaises((ValidationError, ValueError, TypeError)):
-                # Try to use malicious input as config name
-                config_handler.load_config(malicious_input)
-    
-    def test_path_traversal_prevention(self):
-        """Test path traversal attack prevention."""
-        malicious_paths = [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32\\config\\sam",
-            "....//....//....//etc/passwd",
-            "..%2F..%2F..%2Fetc%2Fpasswd",
-            "..%5C..%5C..%5Cwindows%5Csystem32%5Cconfig%5Csam",
-            "/etc/passwd",
-            "C:\\windows\\system32\\config\\sam",
-            "~/.ssh/id_rsa",
-            "/root/.ssh/id_rsa"
-        ]
-        
-        for malicious_path in malicious_paths:
-            # Test config file loading
-            with self.assertRaises((ValidationError, ValueError, OSError)):
-                config_handler.load_config(malicious_path)
-            
-            # Test wildcard file loading
-            with self.assertRaises((ValidationError, ValueError, OSError)):
-                wildcard_manager = self.wildcard_factory.get_manager('wildcards')
-                wildcard_manager.get_wildcard_values(malicious_path)
+    # SQL injection attempts used as config names
+    _SQLI = (
+        "'; DROP TABLE configs; --",
+        "' OR '1'='1",
+        "'; INSERT INTO configs VALUES ('hack', '{}'); --",
+        "'; UPDATE configs SET name='hacked'; --",
+        "'; DELETE FROM configs; --",
+        "'; EXEC xp_cmdshell('dir'); --",
+        "'; SELECT * FROM users WHERE id=1 OR '1'='1'; --"
+    )
+    
+    # Path traversal attempts
+    _PATHS = (
+        "../../../etc/passwd",
+        "..\\..\\..\\windows\\system32\\config\\sam",
+        "....//....//....//etc/passwd",
+        "..%2F..%2F..%2Fetc%2Fpasswd",
+        "..%5C..%5C..%5Cwindows%5Csystem32%5Cconfig%5Csam",
+        "/etc/passwd",
+        "C:\\windows\\system32\\config\\sam",
+        "~/.ssh/id_rsa",
+        "/root/.ssh/id_rsa"
+    )
+    
+    # XSS payloads for the sanitizer
+    _XSS = (
+        "<script>alert('xss')</script>",
+        "javascript:alert('xss')",
+        "<img src=x onerror=alert('xss')>",
+        "<svg onload=alert('xss')>",
+        "<iframe src=javascript:alert('xss')>",
+        "javascript:void(alert('xss'))",
+        "<body onload=alert('xss')>",
+        "<input onfocus=alert('xss') autofocus>",
+        "<details open ontoggle=alert('xss')>",
+        "<marquee onstart=alert('xss')>"
+    )
+    
+    # Command injection attempts used as filenames
+    _CMDI = (
+        "; rm -rf /",
+        "& del C:\\Windows\\System32",
+        "| cat /etc/passwd",
+        "`whoami`",
+        "$(id)",
+        "&& echo hacked",
+        "|| echo hacked",
+        "; ping -c 1 attacker.com",
+        "& nslookup attacker.com"
+    )
+    
+    # Headers that must not pass authentication
+    _AUTH_BYPASS = (
+        {'Authorization': 'Bearer invalid_token'},
+        {'X-API-Key': 'fake_key'},
+        {'Cookie': 'session=fake_session'},
+        {'Authorization': _FAKE_BASIC_AUTH},
+        {'X-Forwarded-For': '127.0.0.1'},
+        {'User-Agent': 'curl/7.68.0'},
+        {'X-Real-IP': '127.0.0.1'}
+    )
     
     def test_xss_prevention(self):
         """Test XSS prevention in web dashboard."""
-        malicious_inputs = [
-            "<script>alert('xss')</script>",
-            "javascript:alert('xss')",
-            "<img src=x onerror=alert('xss')>",
-            "<svg onload=alert('xss')>",
-            "<iframe src=javascript:alert('xss')>",
-            "javascript:void(alert('xss'))",
-            "<body onload=alert('xss')>",
-            "<input onfocus=alert('xss') autofocus>",
-            "<details open ontoggle=alert('xss')>",
-            "<marquee onstart=alert('xss')>"
-        ]
-        
-        for malicious_input in malicious_inputs:
+        for malicious_input in self._XSS:
             sanitized = self._sanitize_input(malicious_input)
             
             # Check for script tags
@@ -118,42 +169,19 @@ class TestSecurityVulnerabilities(TestCase):
             self.assertNotIn('javascript:', sanitized.lower(), f"JavaScript protocol found in sanitized input: {sanitized}")
             
             # Check for event handlers
-            event_handlers = ['onload', 'onerror', 'onfocus', 'ontoggle', 'onstart']
-            for handler in event_handlers:
+            for handler in _EVENT_HANDLERS:
                 self.assertNotIn(handler, sanitized.lower(), f"Event handler {handler} found in sanitized input: {sanitized}")
     
     def test_command_injection_prevention(self):
         """Test command injection prevention."""
-        malicious_inputs = [
-            "; rm -rf /",
-            "& del C:\\Windows\\System32",
-            "| cat /etc/passwd",
-            "`whoami`",
-            "$(id)",
-            "&& echo hacked",
-            "|| echo hacked",
-            "; ping -c 1 attacker.com",
-            "& nslookup attacker.com"
-        ]
-        
-        for malicious_input in malicious_inputs:
+        for malicious_input in self._CMDI:
             with self.assertRaises((ValidationError, ValueError, OSError)):
                 # Try to use malicious input in file operations
                 self._process_file_operation(malicious_input)
     
     def test_authentication_bypass(self):
         """Test authentication bypass prevention."""
-        bypass_attempts = [
-            {'Authorization': 'Bearer invalid_token'},
-            {'X-API-Key': 'fake_key'},
-            {'Cookie': 'session=fake_session'},
-            {'Authorization': 'Basic ' + base64.b64encode(b'fake:fake').decode()},
-            {'X-Forwarded-For': '127.0.0.1'},
-            {'User-Agent': 'curl/7.68.0'},
-            {'X-Real-IP': '127.0.0.1'}
-        ]
-        
-        for attempt in bypass_attempts:
+        for attempt in self._AUTH_BYPASS:
             # Test that authentication is required
             with self.assertRaises((ValidationError, ValueError, PermissionError)):
                 self._make_authenticated_request('/api/admin/configs', headers=attempt)
@@ -219,7 +247,7 @@ class TestSecurityVulnerabilities(TestCase):
             ("test.txt", b"<script>alert('xss')</script>"),
             ("test.json", b'{"name": "<script>alert(\'xss\')</script>"}'),
             # Very large files
-            ("large.txt", b"a" * (10 * 1024 * 1024))  # 10MB
+            ("large.txt", _LengthOnlyBytes(10 * 1024 * 1024))  # 10MB
         ]
         
         for filename, content in malicious_files:
@@ -228,16 +256,17 @@ class TestSecurityVulnerabilities(TestCase):
     
     def test_memory_exhaustion_prevention(self):
         """Test memory exhaustion attack prevention."""
-        # Test with very large inputs that could cause memory issues
-        large_inputs = [
-            "a" * (100 * 1024 * 1024),  # 100MB string
-            ["a" * 1000] * 10000,  # Large list
-            {"key" + str(i): "value" * 1000 for i in range(10000)}  # Large dict
-        ]
-        
-        for large_input in large_inputs:
+        # Test with very large inputs that could cause memory issues,
+        # built one at a time so only one of them is alive at once
+        def large_inputs():
+            yield "a" * (MAX_LARGE_INPUT_LENGTH + 1)  # Just over the 1MB limit
+            yield ["a" * 1000] * 10000  # Large list
+            yield {"key" + str(i): "value" * 1000 for i in range(10000)}  # Large dict
+        
+        for large_input in large_inputs():
             with self.assertRaises((ValidationError, ValueError, MemoryError)):
                 self._process_large_input(large_input)
+            del large_input
     
     def test_dos_prevention(self):
         """Test denial of service prevention."""
@@ -301,34 +330,27 @@ class TestSecurityVulnerabilities(TestCase):
         self.assertFalse(self._verify_password("wrong_password", hashed))
     
     # Helper methods
-    def _sanitize_input(self, input_text):
+    @staticmethod
+    def _sanitize_input(input_text):
         """Sanitize input for XSS prevention."""
-        # Basic XSS sanitization
-        sanitized = input_text
-        
-        # Remove script tags
-        sanitized = re.sub(r'<script[^>]*>.*?</script>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove javascript protocol
-        sanitized = re.sub(r'javascript:', '', sanitized, flags=re.IGNORECASE)
+        if len(input_text) > MAX_SANITIZE_LENGTH:
+            raise ValidationError("Input too long")
         
-        # Remove event handlers
-        event_handlers = ['onload', 'onerror', 'onfocus', 'ontoggle', 'onstart', 'onclick', 'onmouseover']
-        for handler in event_handlers:
-            sanitized = re.sub(rf'{handler}\s*=', '', sanitized, flags=re.IGNORECASE)
+        # Basic XSS sanitization: remove script tags, the javascript protocol and event handlers
+        sanitized = input_text
+        for pattern in _SANITIZE_PATTERNS:
+            sanitized = pattern.sub('', sanitized)
         
         return sanitized
     
-    def _process_file_operation(self, filename):
+    @staticmethod
+    def _process_file_operation(filename):
         """Process a file operation (simulated)."""
         # Simulate file operation that should validate input
-        if any(char in filename for char in [';', '&', '|', '`', '$', '(', ')']):
+        if len(filename.translate(_SHELL_CHARS_TABLE)) != len(filename):
             raise ValidationError("Invalid characters in filename")
         
-        if '..' in filename:
-            raise ValidationError("Path traversal not allowed")
-        
-        return f"processed_{filename}"
+        return f"processed_{_canonicalize(filename)}"
     
     def _make_authenticated_request(self, endpoint, headers=None):
         """Make an authenticated request (simulated)."""
@@ -354,37 +376,42 @@ class TestSecurityVulnerabilities(TestCase):
         
         return {"success": True}
     
-    def _validate_input(self, input_text):
+    @staticmethod
+    def _validate_input(input_text):
         """Validate input (simulated)."""
         # Simulate input validation
-        if '\x00' in input_text:
-            raise ValidationError("Null bytes not allowed")
-        
         if len(input_text) > 1000:
             raise ValidationError("Input too long")
         
-        dangerous_chars = ['<', '>', '"', "'", '&', '|', ';', '`', '$', '(', ')']
-        if any(char in input_text for char in dangerous_chars):
+        # One scan finds null bytes and dangerous characters alike
+        match = _UNSAFE_INPUT_RE.search(input_text)
+        if match:
+            if match.group() == '\x00':
+                raise ValidationError("Null bytes not allowed")
             raise ValidationError("Dangerous characters not allowed")
         
         return input_text
     
-    def _upload_file(self, filename, content):
+    @staticmethod
+    def _upload_file(filename, content):
         """Upload a file (simulated)."""
-        # Simulate file upload validation
-        dangerous_extensions = ['.exe', '.bat', '.sh', '.py', '.php', '.jsp', '.asp']
-        if any(filename.lower().endswith(ext) for ext in dangerous_extensions):
-            raise ValidationError("Dangerous file type not allowed")
-        
+        # Simulate file upload validation, cheapest check first
         if len(content) > 1024 * 1024:  # 1MB limit
             raise ValidationError("File too large")
         
+        name = filename.lower()
+        dot = name.rfind('.')
+        extension = name[dot + 1:] if dot >= 0 else ''
+        if extension in _DANGEROUS_EXTENSIONS:
+            raise ValidationError("Dangerous file type not allowed")
+        
         return f"uploaded_{filename}"
     
-    def _process_large_input(self, large_input):
+    @staticmethod
+    def _process_large_input(large_input):
         """Process large input (simulated)."""
         # Simulate large input processing
-        if isinstance(large_input, str) and len(large_input) > 1024 * 1024:  # 1MB limit
+        if isinstance(large_input, str) and len(large_input) > MAX_LARGE_INPUT_LENGTH:
             raise ValidationError("Input too large")
         
         if isinstance(large_input, list) and len(large_input) > 1000:
@@ -395,11 +422,19 @@ class TestSecurityVulnerabilities(TestCase):
         
         return "processed"
     
-    def _process_complex_input(self, complex_input):
+    @staticmethod
+    def _process_complex_input(complex_input):
         """Process complex input (simulated)."""
-        # Simulate complex input processing
-        if complex_input.count('{') > 100 or complex_input.count('(') > 100:
-            raise ValidationError("Input too complex")
+        # Simulate complex input processing: find up to 101 of each bracket with
+        # str.find, so scanning stops as soon as the limit of 100 is passed
+        for bracket in ('{', '('):
+            position = -1
+            for _ in range(101):
+                position = complex_input.find(bracket, position + 1)
+                if position < 0:
+                    break
+            else:
+                raise ValidationError("Input too complex")
         
         return "processed"
     
@@ -426,41 +461,82 @@ class TestSecurityVulnerabilities(TestCase):
         # Simulate session timeout
         raise PermissionError("Session expired")
     
-    def _hash_password(self, password):
+    @staticmethod
+    def _hash_password(password):
         """Hash password (simulated)."""
         # Simulate password hashing
         import hashlib
         import os
-        salt = os.urandom(16).hex()
-        return hashlib.sha256((password + salt).encode()).hexdigest() + ":" + salt
+        salt = os.urandom(16)
+        digest = hashlib.blake2b(password.encode('utf-8'), salt=salt, digest_size=32).hexdigest()
+        return digest + ":" + salt.hex()
     
-    def _verify_password(self, password, hashed):
+    @staticmethod
+    def _verify_password(password, hashed):
         """Verify password (simulated)."""
         # Simulate password verification
         import hashlib
+        import hmac
         if ':' not in hashed:
             return False
         
-        hash_part, salt = hashed.rsplit(':', 1)
-        expected_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        return hash_part == expected_hash
+        hash_part, salt_hex = hashed.rsplit(':', 1)
+        try:
+            salt = bytes.fromhex(salt_hex)
+        except ValueError:
+            return False
+        
+        expected_hash = hashlib.blake2b(password.encode('utf-8'), salt=salt, digest_size=32).hexdigest()
+        return hmac.compare_digest(hash_part, expected_hash)
+
+
+# SQL injection and path traversal inputs run as parametrized tests, so each input
+# is reported on its own and can be spread across xdist workers
+@pytest.fixture(scope="module")
+def wildcard_factory():
+    """Wildcard manager factory, run from a temporary workspace with the directories the core modules expect."""
+    temp_dir = tempfile.mkdtemp()
+    original_cwd = os.getcwd()
+    os.chdir(temp_dir)
+    for directory in ('configs', 'wildcards', 'outputs'):
+        os.makedirs(directory, exist_ok=True)
+    
+    yield WildcardManagerFactory()
+    
+    os.chdir(original_cwd)
+    import shutil
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def wildcard_manager(wildcard_factory):
+    """Wildcard manager shared by every path traversal case."""
+    return wildcard_factory.get_manager('wildcards')
+
+
+@pytest.mark.parametrize("malicious_input", TestSecurityVulnerabilities._SQLI)
+def test_sql_injection_prevention(malicious_input):
+    """Test SQL injection prevention."""
+    with pytest.raises((ValidationError, ValueError, TypeError)):
+        # Try to use malicious input as config name
+        config_handler.load_config(malicious_input)
+
+
+@pytest.mark.parametrize("malicious_path", TestSecurityVulnerabilities._PATHS)
+def test_path_traversal_prevention(malicious_path, wildcard_manager):
+    """Test path traversal attack prevention."""
+    # Test config file loading
+    with pytest.raises((ValidationError, ValueError, OSError)):
+        config_handler.load_config(malicious_path)
+    
+    # Test wildcard file loading
+    with pytest.raises((ValidationError, ValueError, OSError)):
+        wildcard_manager.get_wildcard_values(malicious_path)
 
 
 class TestWebSecurity(TestCase):
     """Web-specific security tests."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.temp_dir)
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.chdir(self.original_cwd)
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
     def test_http_security_headers(self):
         """Test HTTP security headers."""
         # Test that security headers are present
@@ -516,17 +592,20 @@ class TestWebSecurity(TestCase):
             self.assertFalse(self._is_cors_allowed(origin), f"CORS allowed for malicious origin: {origin}")
     
     # Helper methods
-    def _has_security_header(self, header_name):
+    @staticmethod
+    def _has_security_header(header_name):
         """Check if security header is present (simulated)."""
         # Simulate security header check
         return True  # Assume headers are present
     
-    def _enforce_https(self, http_url):
+    @staticmethod
+    def _enforce_https(http_url):
         """Enforce HTTPS (simulated)."""
         # Simulate HTTPS redirect
         return http_url.replace('http://', 'https://')
     
-    def _is_cors_allowed(self, origin):
+    @staticmethod
+    def _is_cors_allowed(origin):
         """Check if CORS is allowed (simulated)."""
         # Simulate CORS check
         allowed_origins = ['localhost', '127.0.0.1']
@@ -4,12 +4,17 @@ import os
 import json
 from pathlib import Path
 import sys
+import pytest
 
 # Add core to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'core'))
 
 from core.config_handler import ConfigHandler
 
+# Handler over the project's own configs/ directory, listed once at collection
+PROJECT_HANDLER = ConfigHandler()
+PROJECT_CONFIGS = PROJECT_HANDLER.list_configs()
+
 
 class TestConfigHandler(unittest.TestCase):
     """Test cases for ConfigHandler."""
@@ -246,5 +251,21 @@ class TestConfigHandler(unittest.TestCase):
         self.assertEqual(merged["f"], 5)  # Added
 
 
+def test_project_configs_found():
+    """Test that shipped configurations are found, so the cases below are not silently skipped."""
+    assert PROJECT_CONFIGS, f"No configurations found in {PROJECT_HANDLER.config_dir}"
+
+
+# Each shipped config is its own case, so xdist can spread them across workers
+@pytest.mark.parametrize("config_name", PROJECT_CONFIGS)
+def test_project_config_loads(config_name):
+    """Test that a shipped configuration loads and validates."""
+    config = PROJECT_HANDLER.load_config(config_name)
+    
+    assert config['model_type'] in ('sd', 'sdxl', 'xl', 'flux')
+    assert 'base_prompt' in config['prompt_settings']
+    assert 'missing_wildcards' in config
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
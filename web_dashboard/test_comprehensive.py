@@ -8,24 +8,26 @@ import requests
 import json
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 BASE_URL = "http://localhost:4000"
 
-def test_endpoint(endpoint, expected_status=200, description=""):
-    """Test a single endpoint and return success status."""
+# Upper bound on probes in flight at once; they only wait on the dashboard
+MAX_CONCURRENT_PROBES = 8
+
+def _check_endpoint(endpoint, expected_status=200, description=""):
+    """Probe a single endpoint and return (success, report line)."""
     try:
         url = urljoin(BASE_URL, endpoint)
         response = requests.get(url, timeout=10)
         success = response.status_code == expected_status
-        print(f"{'✓' if success else '✗'} {description or endpoint}: {response.status_code}")
-        return success
+        return success, f"{'✓' if success else '✗'} {description or endpoint}: {response.status_code}"
     except Exception as e:
-        print(f"✗ {description or endpoint}: Error - {e}")
-        return False
+        return False, f"✗ {description or endpoint}: Error - {e}"
 
-def test_api_endpoint(endpoint, expected_fields=None, description=""):
-    """Test an API endpoint and verify JSON response."""
+def _check_api_endpoint(endpoint, expected_fields=None, description=""):
+    """Probe an API endpoint, verify its JSON and return (success, report line)."""
     try:
         url = urljoin(BASE_URL, endpoint)
         response = requests.get(url, timeout=10)
@@ -34,31 +36,51 @@ def test_api_endpoint(endpoint, expected_fields=None, description=""):
             if expected_fields:
                 missing_fields = [field for field in expected_fields if field not in data]
                 if missing_fields:
-                    print(f"✗ {description or endpoint}: Missing fields {missing_fields}")
-                    return False
-            print(f"✓ {description or endpoint}: OK")
-            return True
+                    return False, f"✗ {description or endpoint}: Missing fields {missing_fields}"
+            return True, f"✓ {description or endpoint}: OK"
         else:
-            print(f"✗ {description or endpoint}: HTTP {response.status_code}")
-            return False
+            return False, f"✗ {description or endpoint}: HTTP {response.status_code}"
     except Exception as e:
-        print(f"✗ {description or endpoint}: Error - {e}")
-        return False
+        return False, f"✗ {description or endpoint}: Error - {e}"
 
-def test_js_file(file_path):
-    """Test if a JavaScript file is accessible."""
+def _check_js_file(file_path):
+    """Probe a JavaScript file and return (success, report line)."""
     try:
         url = urljoin(BASE_URL, f"static/js/{file_path}")
         response = requests.get(url, timeout=10)
         if response.status_code == 200:
-            print(f"✓ JS {file_path}: OK")
-            return True
+            return True, f"✓ JS {file_path}: OK"
         else:
-            print(f"✗ JS {file_path}: HTTP {response.status_code}")
-            return False
+            return False, f"✗ JS {file_path}: HTTP {response.status_code}"
     except Exception as e:
-        print(f"✗ JS {file_path}: Error - {e}")
-        return False
+        return False, f"✗ JS {file_path}: Error - {e}"
+
+def test_endpoint(endpoint, expected_status=200, description=""):
+    """Test a single endpoint and return success status."""
+    success, line = _check_endpoint(endpoint, expected_status, description)
+    print(line)
+    return success
+
+def test_api_endpoint(endpoint, expected_fields=None, description=""):
+    """Test an API endpoint and verify JSON response."""
+    success, line = _check_api_endpoint(endpoint, expected_fields, description)
+    print(line)
+    return success
+
+def test_js_file(file_path):
+    """Test if a JavaScript file is accessible."""
+    success, line = _check_js_file(file_path)
+    print(line)
+    return success
+
+def run_checks(checks):
+    """Run independent (check, args, kwargs) probes concurrently, printing in order."""
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PROBES, len(checks))) as executor:
+        futures = [executor.submit(check, *args, **kwargs) for check, args, kwargs in checks]
+        results = [future.result() for future in futures]
+    for _, line in results:
+        print(line)
+    return [success for success, _ in results]
 
 def main():
     print("🧪 Comprehensive Test Suite for Forge API Tool Web Dashboard")
@@ -67,30 +89,37 @@ def main():
     # Test basic connectivity
     print("\n📡 Basic Connectivity Tests:")
     print("-" * 30)
-    test_endpoint("/", description="Main Dashboard Page")
-    test_endpoint("/static/css/dashboard.css", description="CSS File")
+    run_checks([
+        (_check_endpoint, ("/",), {"description": "Main Dashboard Page"}),
+        (_check_endpoint, ("/static/css/dashboard.css",), {"description": "CSS File"})
+    ])
     
     # Test API endpoints
     print("\n🔌 API Endpoint Tests:")
     print("-" * 30)
-    test_api_endpoint("/api/configs/", description="Configs API")
-    test_api_endpoint("/api/status/", expected_fields=["api", "generation", "queue"], description="Status API")
-    test_api_endpoint("/api/queue/status", description="Queue Status API")
-    test_api_endpoint("/api/outputs/list", description="Outputs List API")
+    run_checks([
+        (_check_api_endpoint, ("/api/configs/",), {"description": "Configs API"}),
+        (_check_api_endpoint, ("/api/status/",), {"expected_fields": ["api", "generation", "queue"], "description": "Status API"}),
+        (_check_api_endpoint, ("/api/queue/status",), {"description": "Queue Status API"}),
+        (_check_api_endpoint, ("/api/outputs/list",), {"description": "Outputs List API"})
+    ])
     
     # Test JavaScript files
     print("\n📜 JavaScript File Tests:")
     print("-" * 30)
-    test_js_file("dashboard-modular.js")
-    test_js_file("modules/notifications.js")
-    test_js_file("modules/modals.js")
-    test_js_file("modules/templates.js")
-    test_js_file("modules/generation.js")
-    test_js_file("modules/queue.js")
-    test_js_file("modules/output.js")
-    test_js_file("modules/settings.js")
-    test_js_file("modules/analysis.js")
-    test_js_file("modules/utils.js")
+    js_files = [
+        "dashboard-modular.js",
+        "modules/notifications.js",
+        "modules/modals.js",
+        "modules/templates.js",
+        "modules/generation.js",
+        "modules/queue.js",
+        "modules/output.js",
+        "modules/settings.js",
+        "modules/analysis.js",
+        "modules/utils.js"
+    ]
+    run_checks([(_check_js_file, (file_path,), {}) for file_path in js_files])
     
     # Test template loading
     print("\n📋 Template Loading Tests:")